@@ -0,0 +1,16 @@
+"""FigureIt AI engine: agents, models and orchestration for career guidance."""
+
+import logging
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Attach a handler for CLI and API entry points.
+
+    Library modules only call ``logging.getLogger(__name__)`` and never
+    configure global state on import (which would be unsafe under
+    server reloads); the process entry point opts in here instead.
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
@@ -0,0 +1,82 @@
+"""Short-TTL async cache and the single-flight primitive beneath it.
+
+``SingleFlight.do`` coalesces concurrent calls for the same key onto
+one in-flight coroutine — a burst of identical requests costs one fetch
+instead of N. Errors are never shared state: every waiter of a failed
+flight sees the exception, and the next caller retries.
+
+``AsyncTTLCache.get`` layers a freshness window on top: a cached value
+is returned while it is fresh, misses dedupe through single-flight.
+
+Single-loop only (the orchestrator's event loop); no locks are needed
+because all bookkeeping happens between awaits.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        # key -> future resolved by whichever caller got there first.
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(
+        self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``coro_factory`` for ``key`` at most once concurrently.
+
+        The first caller runs the coroutine; callers arriving while it
+        is in flight await the same result (shielded, so one waiter
+        being cancelled does not kill the shared flight).
+        """
+        waiting = self._inflight.get(key)
+        if waiting is not None:
+            return await asyncio.shield(waiting)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await coro_factory()
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved for lone flights
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+
+class AsyncTTLCache:
+    def __init__(self, *, ttl: float, maxsize: int = 1024) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # key -> (expires_at, value); ordered so eviction drops the
+        # least recently used entry.
+        self._done: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flight = SingleFlight()
+
+    async def get(
+        self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for ``key``, fetching it at most once.
+
+        ``coro_factory`` is only called on a cold miss; concurrent
+        callers for the same key await the first caller's result.
+        """
+        entry = self._done.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._done.move_to_end(key)
+                return value
+            del self._done[key]
+
+        value = await self._flight.do(key, coro_factory)
+        self._done[key] = (time.monotonic() + self._ttl, value)
+        while len(self._done) > self._maxsize:
+            self._done.popitem(last=False)
+        return value
@@ -0,0 +1,64 @@
+"""Shared OpenAI clients and environment loading for all agents.
+
+Importing this module parses ``.env`` exactly once per process; the one
+sync and one async client are built lazily on first attribute access
+(PEP 562) over explicitly sized httpx pools, so every agent shares warm
+keep-alive TLS connections instead of each opening its own and
+re-handshaking per call. Lazy so that offline paths — bulk scoring,
+batch evidence, serde, test collection — import cleanly without an
+``OPENAI_API_KEY``; the missing-credentials error surfaces on the first
+actual call.
+
+Agents resolve ``_client.client`` / ``_client.aclient`` at call time
+rather than importing the objects, so :func:`set_clients` can swap in a
+caller-configured client (tests, deployments with their own pool) and
+later calls pick it up.
+"""
+
+import os
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
+
+load_dotenv()
+
+API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Sized for the orchestrator's fan-out: a full analysis holds a handful
+# of concurrent calls, and bursts across users share the same pool.
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def __getattr__(name: str):
+    # ``client`` / ``aclient`` are absent from the module namespace
+    # until first accessed (or injected via set_clients); building them
+    # here caches the instance as a plain module global, so only the
+    # first access pays this path.
+    if name == "client":
+        value = OpenAI(api_key=API_KEY, http_client=httpx.Client(limits=_LIMITS))
+    elif name == "aclient":
+        value = AsyncOpenAI(
+            api_key=API_KEY, http_client=httpx.AsyncClient(limits=_LIMITS)
+        )
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def set_clients(
+    sync_client: Optional[OpenAI] = None,
+    async_client: Optional[AsyncOpenAI] = None,
+) -> None:
+    """Replace the process-wide shared clients.
+
+    Process-wide on purpose: a single pool is the point, so the last
+    caller wins and all agents follow.
+    """
+    global client, aclient
+    if sync_client is not None:
+        client = sync_client
+    if async_client is not None:
+        aclient = async_client
@@ -0,0 +1,327 @@
+"""In-process content-addressed cache for LLM completions.
+
+The expensive hot path of every agent is ``chat.completions.create`` —
+hundreds of ms to seconds per call — and the payloads are highly
+repetitive (same system prompt, similar user states). ``completion``
+routes a call through a bounded LRU keyed on a sha256 of everything that
+affects the output. Only deterministic (temperature 0) calls are cached
+unless the caller explicitly opts in.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _canonical(payload: Dict) -> str:
+        return orjson.dumps(
+            payload, option=orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+
+    def _canonical(payload: Dict) -> str:
+        return json.dumps(payload, sort_keys=True, default=str)
+
+
+try:
+    import openai
+    from tenacity import (
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_random_exponential,
+    )
+
+    # Transient failures a retry can actually fix; anything else should
+    # surface to the caller's fallback immediately.
+    _RETRYABLE = (
+        openai.RateLimitError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
+
+    def _with_retry(fn):
+        return retry(
+            stop=stop_after_attempt(3),
+            wait=wait_random_exponential(min=0.5, max=8),
+            retry=retry_if_exception_type(_RETRYABLE),
+            reraise=True,
+        )(fn)
+
+except ImportError:  # tenacity is optional; without it calls run once
+
+    def _with_retry(fn):
+        return fn
+
+
+@_with_retry
+def _create(client: Any, **kwargs: Any) -> Any:
+    return client.chat.completions.create(**kwargs)
+
+
+@_with_retry
+async def _create_async(client: Any, **kwargs: Any) -> Any:
+    return await client.chat.completions.create(**kwargs)
+
+
+_MAX_ENTRIES = 1024
+
+_cache: "OrderedDict[str, str]" = OrderedDict()
+_counters: Counter = Counter()
+
+# Bounds concurrent in-flight completions across all async agents so a
+# burst of users cannot trip the API rate limit.
+_SEMAPHORE = asyncio.Semaphore(8)
+
+# Rolling per-agent latency samples (ns) for the real completions only;
+# cache hits are excluded so percentiles reflect the API, not the dict.
+_LATENCY_WINDOW = 1000
+_latencies: "defaultdict[str, deque]" = defaultdict(
+    lambda: deque(maxlen=_LATENCY_WINDOW)
+)
+
+_LOG_EVERY = 200
+_THRASH_MIN_CALLS = 1000
+_THRASH_RATIO = 0.1
+
+
+def _record_latency(agent: str, elapsed_ns: int) -> None:
+    _latencies[agent].append(elapsed_ns)
+
+
+def _maybe_log_ratio() -> None:
+    total = _counters["hit"] + _counters["miss"]
+    if total == 0 or total % _LOG_EVERY:
+        return
+    ratio = _counters["hit"] / total
+    logger.info("LLM cache hit ratio %.2f over %d calls", ratio, total)
+    if total >= _THRASH_MIN_CALLS and ratio < _THRASH_RATIO:
+        logger.warning(
+            "LLM cache is thrashing (hit ratio %.2f over %d calls); "
+            "inputs may be too diverse to cache",
+            ratio,
+            total,
+        )
+
+
+def latency_percentiles(agent: str) -> Dict[str, float]:
+    """p50/p95/p99 completion latency in ms for one agent label."""
+    samples = _latencies.get(agent)
+    if not samples:
+        return {}
+    arr = np.asarray(samples, dtype=np.float64) / 1e6
+    p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+    return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+def make_key(
+    model: str,
+    system_prompt: str,
+    user_content: str,
+    temperature: float,
+) -> str:
+    blob = f"{model}|{temperature}|{system_prompt}|{user_content}"
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def completion(
+    client: Any,
+    model: str,
+    system_prompt: str,
+    payload: Union[str, Dict],
+    *,
+    temperature: float = 0.0,
+    cacheable: Optional[bool] = None,
+    agent: Optional[str] = None,
+    **kwargs: Any,
+) -> str:
+    """Run a chat completion through the cache and return its content.
+
+    ``payload`` may be a raw user string or a dict, which is canonically
+    JSON-encoded so key equality survives dict ordering. ``agent`` labels
+    the latency samples; it defaults to the model name.
+    """
+    if cacheable is None:
+        cacheable = temperature == 0.0
+
+    if isinstance(payload, str):
+        user_content = payload
+    else:
+        user_content = _canonical(payload)
+
+    key = make_key(model, system_prompt, user_content, temperature)
+    if cacheable:
+        cached = _cache.get(key)
+        if cached is not None:
+            _counters["hit"] += 1
+            _maybe_log_ratio()
+            _cache.move_to_end(key)
+            return cached
+    _counters["miss"] += 1
+    _maybe_log_ratio()
+
+    start = time.perf_counter_ns()
+    response = _create(
+        client,
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+        temperature=temperature,
+        **kwargs,
+    )
+    _record_latency(agent or model, time.perf_counter_ns() - start)
+    content = response.choices[0].message.content
+
+    if cacheable:
+        _cache[key] = content
+        if len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return content
+
+
+async def _consume_json_stream(
+    client: Any,
+    model: str,
+    messages: list,
+    temperature: float,
+    **kwargs: Any,
+) -> str:
+    """Stream a JSON-object completion, returning as soon as it closes.
+
+    Tracking brace depth while chunks arrive means parsing work overlaps
+    token generation and the call returns at the closing brace instead
+    of waiting for the server to finalize the stream. The scanner tracks
+    string and escape state so braces inside string values (code
+    snippets, literal examples) never count toward the depth.
+    """
+    response = await _create_async(
+        client,
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+        **kwargs,
+    )
+    parts = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+    async for chunk in response:
+        delta = chunk.choices[0].delta.content or ""
+        if not delta:
+            continue
+        parts.append(delta)
+        for ch in delta:
+            if escaped:
+                escaped = False
+            elif in_string:
+                if ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+                started = True
+            elif ch == "}":
+                depth -= 1
+        if started and depth == 0 and not in_string:
+            break
+    return "".join(parts)
+
+
+async def completion_async(
+    client: Any,
+    model: str,
+    system_prompt: str,
+    payload: Union[str, Dict],
+    *,
+    temperature: float = 0.0,
+    cacheable: Optional[bool] = None,
+    stream_json: bool = False,
+    agent: Optional[str] = None,
+    **kwargs: Any,
+) -> str:
+    """Async twin of :func:`completion`, sharing the same cache.
+
+    With ``stream_json=True`` the response is streamed and returned as
+    soon as the outermost JSON object closes (requires a JSON response
+    format).
+    """
+    if cacheable is None:
+        cacheable = temperature == 0.0
+
+    if isinstance(payload, str):
+        user_content = payload
+    else:
+        user_content = _canonical(payload)
+
+    key = make_key(model, system_prompt, user_content, temperature)
+    if cacheable:
+        cached = _cache.get(key)
+        if cached is not None:
+            _counters["hit"] += 1
+            _maybe_log_ratio()
+            _cache.move_to_end(key)
+            return cached
+    _counters["miss"] += 1
+    _maybe_log_ratio()
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content},
+    ]
+    async with _SEMAPHORE:
+        start = time.perf_counter_ns()
+        if stream_json:
+            content = await _consume_json_stream(
+                client, model, messages, temperature, **kwargs
+            )
+        else:
+            response = await _create_async(
+                client,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                **kwargs,
+            )
+            content = response.choices[0].message.content
+        _record_latency(agent or model, time.perf_counter_ns() - start)
+
+    if cacheable:
+        if stream_json:
+            # A stream the scanner cut short would otherwise pin its
+            # broken prefix in the cache until LRU eviction; never cache
+            # streamed content that does not parse.
+            try:
+                json.loads(content)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "not caching unparseable streamed JSON (agent=%s)",
+                    agent or model,
+                )
+                return content
+        _cache[key] = content
+        if len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return content
+
+
+def stats() -> Dict[str, int]:
+    """Hit/miss counters, for judging whether the cache earns its keep."""
+    return dict(_counters)
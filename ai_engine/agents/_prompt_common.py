@@ -0,0 +1,138 @@
+"""Shared prompt prefix for the post-decision agents.
+
+Server-side prefix caching (OpenAI automatic prefix caching, vLLM) only
+reuses KV blocks while prompts are byte-identical from the first token,
+so the three post-decision agents share one system prompt and open
+their user message with the same canonical dump of the user-state
+slice; only a short ``### TASK`` suffix differs per agent. All three
+call the same model at temperature 0, so within one analysis the second
+and third calls prefill almost nothing.
+"""
+
+from typing import Dict, Optional
+
+try:
+    import orjson
+
+    def _dumps(obj: Dict) -> str:
+        # Sorted keys keep the prefix byte-stable across call sites.
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json
+
+    def _dumps(obj: Dict) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+
+from ai_engine.models.user_state import UserState
+
+# One instruction block for all three tasks: per-task rules live in the
+# suffix so the shared tokens stay identical.
+SYSTEM_PROMPT = (
+    "You act on a learner's career-path decision. The user message "
+    "opens with shared state: dec{f=focus, p=parked, dr=dropped, "
+    "s=scores, u=urgency}, ctx{h=weekly hours, d=deadline months}, "
+    "e=evidence flags, i=primary interests. A ### TASK line then "
+    "selects your job, its extra inputs and its output schema. Reply "
+    "with JSON only; never invent data."
+)
+
+TASK_RULES = {
+    "advise": (
+        'Output JSON: {"advice": "...", "watchouts": ["..."]}. Rules: one '
+        "concrete 30-day priority; at most two watchouts; no platitudes."
+    ),
+    "roadmap": (
+        "Extra inputs: w=weeks. Output JSON: "
+        '{"weeks": [{"week": n, "theme": "...", "tasks": ["..."]}], '
+        '"milestone": "..."}. Rules: scale task volume to h; no filler '
+        "tasks."
+    ),
+    "explain": (
+        "Extra inputs: m=market context per path. Output JSON: "
+        '{"summary": "...", "reasons": ["..."], "tradeoffs": ["..."]}. '
+        "Rules: be honest about weaknesses in the evidence."
+    ),
+}
+
+
+def user_state_preamble(user_state: UserState) -> str:
+    """Canonical dump of the state slice every post-decision task reads."""
+    decision = user_state.decision_state
+    context = user_state.context_profile
+    evidence = user_state.evidence_profile
+    interest = user_state.interest_profile
+    return _dumps(
+        {
+            "dec": None
+            if decision is None
+            else {
+                "f": decision.focus,
+                "p": decision.park,
+                "dr": decision.drop,
+                "s": decision.scores,
+                "u": decision.urgency,
+            },
+            "ctx": None
+            if context is None
+            else {
+                "h": context.hours_per_week,
+                "d": context.deadline_months,
+            },
+            "e": sorted(evidence.flags) if evidence else [],
+            "i": list(interest.primary_interests) if interest else [],
+        }
+    )
+
+
+def task_prompt(
+    user_state: UserState,
+    task: str,
+    extra: Optional[Dict] = None,
+    *,
+    preamble: Optional[str] = None,
+) -> str:
+    """Full user message: shared preamble, then the task-specific tail.
+
+    ``preamble`` swaps in a pre-built prefix (e.g. an LLM summary) in
+    place of the structured dump; all tasks in one analysis must use the
+    same one or the shared-prefix property is lost.
+    """
+    parts = [
+        preamble if preamble is not None else user_state_preamble(user_state),
+        f"### TASK: {task}",
+        TASK_RULES[task],
+    ]
+    if extra:
+        parts.append(_dumps(extra))
+    return "\n".join(parts)
+
+
+SUMMARIZE_PROMPT = (
+    "Compress this user-state JSON into at most three plain sentences "
+    "covering their decision (focus/parked/dropped), time constraints, "
+    "evidence and interests. No preamble, no formatting, no advice."
+)
+
+
+async def summarize_user_state(user_state: UserState) -> str:
+    """One cheap short-output call compressing the full state dump.
+
+    Used when the full state would make the post-decision prompts long:
+    the three tail calls then share this short summary as their prefix
+    instead of re-sending the whole profile each time.
+    """
+    from ai_engine import _client
+    from ai_engine.agents import _llm_cache
+
+    raw = await _llm_cache.completion_async(
+        _client.aclient,
+        "gpt-4o-mini",
+        SUMMARIZE_PROMPT,
+        _dumps(user_state.to_dict()),
+        temperature=0.0,
+        agent="context_summarizer",
+        max_tokens=160,
+    )
+    return raw.strip()
@@ -0,0 +1,249 @@
+"""Conversational front door for FigureIt.
+
+``chat`` classifies the intent of an incoming message and either answers
+directly (casual talk, routing acknowledgements) or hands the message to
+the guarded tutor. Both entry points are coroutines so that concurrent
+chat sessions overlap on network I/O instead of serializing on it;
+callers fan out with ``asyncio.gather(*[chat(s, m) for s, m in batch])``.
+"""
+
+import asyncio
+import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from ai_engine._client import API_KEY
+from ai_engine.models.user_state import UserState
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+MODEL = "gpt-4o-mini"
+
+# One shared ClientSession per event loop: the openai SDK's httpx stack
+# adds substantial client-side overhead per request under concurrency,
+# while a bare aiohttp POST is a single JSON encode/decode. Keyed by
+# loop (same pattern as scrapers._SESSIONS) because a session bound to
+# a finished asyncio.run loop reports closed=False but fails on the
+# next loop; created lazily because a ClientSession must be built on a
+# running loop.
+_SESSIONS: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {API_KEY}"},
+            timeout=aiohttp.ClientTimeout(total=60),
+        )
+        _SESSIONS[loop] = session
+    return session
+
+
+async def _openai_chat(model: str, messages: list, **kwargs: Any) -> str:
+    """POST a chat completion directly and return the message content."""
+    payload = {"model": model, "messages": messages, **kwargs}
+    async with _get_session().post(OPENAI_CHAT_URL, json=payload) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+    return data["choices"][0]["message"]["content"]
+
+VALID_INTENTS = ("casual", "question", "roadmap", "explain", "panic", "override")
+
+INTENT_PROMPT = (
+    "You route messages for a career-guidance assistant. Classify the user "
+    "message into exactly one intent: casual (greetings, thanks, small talk), "
+    "question (a technical question to be tutored on), roadmap (asking about "
+    "their plan or next steps), explain (asking why a decision was made), "
+    "panic (overwhelmed, wants to quit, self-doubt), override (asking to "
+    "change their assigned path). Respond with only the intent word, "
+    "lowercase, nothing else."
+)
+
+# Short messages repeat constantly ("hi", "thanks", "roadmap", ...);
+# resolve the obvious ones without touching the classifier at all, and
+# remember classifier verdicts for everything else in a bounded LRU so a
+# repeated message costs a dict lookup instead of an API round trip.
+_INTENT_KEYWORDS = {
+    "hi": "casual",
+    "hello": "casual",
+    "hey": "casual",
+    "thanks": "casual",
+    "thank you": "casual",
+    "ok": "casual",
+    "roadmap": "roadmap",
+    "help": "panic",
+    "why": "explain",
+    "explain": "explain",
+}
+
+# Most real messages are trivially classifiable; each pattern resolves a
+# whole family of phrasings in microseconds before any LLM is consulted.
+_FASTPATH = (
+    (re.compile(r"\b(help|stop|overwhelm\w*|panic|quit|give up|confused)\b", re.I), "panic"),
+    (re.compile(r"\b(roadmap|what'?s next|next step|plan)\b", re.I), "roadmap"),
+    (re.compile(r"\bwhy\b|\bexplain\b", re.I), "explain"),
+    (re.compile(r"\b(switch|change) (my )?(path|track|focus)\b", re.I), "override"),
+    (re.compile(r"^(hi|hello|hey|thanks|thank you|ok|okay)\b[\s!.]*$", re.I), "casual"),
+)
+
+_INTENT_CACHE_MAX = 1024
+_intent_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+async def _classify_intent(message: str) -> str:
+    """Classify ``message`` into one of VALID_INTENTS, caching by content."""
+    key = message.strip().lower()[:200]
+    fast = _INTENT_KEYWORDS.get(key)
+    if fast is not None:
+        return fast
+    for pattern, intent in _FASTPATH:
+        if pattern.search(key):
+            return intent
+    cached = _intent_cache.get(key)
+    if cached is not None:
+        _intent_cache.move_to_end(key)
+        return cached
+
+    # A bare word is all we need: JSON mode forces the model through a
+    # slower constrained-decoding path for a one-key object, and the
+    # enum is re-validated here anyway.
+    raw = await _openai_chat(
+        MODEL,
+        [
+            {"role": "system", "content": INTENT_PROMPT},
+            {"role": "user", "content": message},
+        ],
+        temperature=0,
+        max_tokens=6,
+        stop=["\n"],
+    )
+    intent = raw.strip().lower()
+    if intent not in VALID_INTENTS:
+        intent = "casual"
+
+    _intent_cache[key] = intent
+    if len(_intent_cache) > _INTENT_CACHE_MAX:
+        _intent_cache.popitem(last=False)
+    return intent
+
+
+BULK_INTENT_PROMPT = (
+    "You route messages for a career-guidance assistant. Classify EACH of "
+    "the following numbered messages into exactly one intent out of: "
+    "casual, question, roadmap, explain, panic, override. Respond with "
+    'JSON: {"intents": ["...", "..."]} with one entry per message, in order.'
+)
+
+_BULK_CHUNK_SIZE = 20
+
+
+async def classify_intents_bulk(messages: List[str]) -> List[str]:
+    """Classify many queued messages with one LLM call per 20 messages.
+
+    Meant for schedulers and eval runs, not the interactive path: packing
+    a chunk into a single prompt cuts N round trips (and their fixed
+    per-call overhead) down to N/20. Order of the result matches input.
+    """
+
+    async def _classify_chunk(chunk: List[str]) -> List[str]:
+        numbered = "\n".join(f"{i + 1}. {m}" for i, m in enumerate(chunk))
+        raw = await _openai_chat(
+            MODEL,
+            [
+                {"role": "system", "content": BULK_INTENT_PROMPT},
+                {"role": "user", "content": numbered},
+            ],
+            temperature=0,
+            response_format={"type": "json_object"},
+        )
+        try:
+            intents = json.loads(raw)["intents"]
+        except (json.JSONDecodeError, KeyError):
+            intents = []
+        if not isinstance(intents, list):
+            # e.g. {"intents": 3} — treat like any other malformed reply.
+            intents = []
+        # Pad/repair so one malformed response never desyncs the batch.
+        intents = [i if i in VALID_INTENTS else "casual" for i in intents]
+        intents += ["casual"] * (len(chunk) - len(intents))
+        return intents[: len(chunk)]
+
+    chunks = [
+        messages[i : i + _BULK_CHUNK_SIZE]
+        for i in range(0, len(messages), _BULK_CHUNK_SIZE)
+    ]
+    results = await asyncio.gather(*(_classify_chunk(c) for c in chunks))
+    return [intent for chunk in results for intent in chunk]
+
+
+_ROUTE_REPLIES = {
+    "roadmap": "Let me pull up your roadmap.",
+    "explain": "Here is the reasoning behind your current plan.",
+    "panic": "Taking a breath with you — let's look at where you actually are.",
+    "override": "Got it, let's revisit your path together.",
+    "casual": "Hey! Ask me anything about your path whenever you're ready.",
+}
+
+
+async def chat(user_state: UserState, message: str) -> Dict[str, str]:
+    """Classify ``message`` and produce a reply plus the routed intent."""
+    intent = await _classify_intent(message)
+
+    if intent == "question":
+        reply = await _safe_tutor(user_state, message)
+    else:
+        reply = _ROUTE_REPLIES[intent]
+    return {"intent": intent, "reply": reply}
+
+
+_STYLE_INSTRUCTIONS = {
+    "theory_heavy": "Lean on intuition and concrete examples before formalism.",
+    "implementation_heavy": "Connect the answer back to underlying theory.",
+    "dsa_beginner": "Keep it beginner friendly; one concept at a time.",
+    None: "Balance theory and code.",
+}
+
+
+@lru_cache(maxsize=256)
+def _system_prompt(focus: str, style_key: Optional[str]) -> str:
+    """Tutor system prompt for a (focus, style) pair.
+
+    The prompt depends only on this small enumerable space, so memoizing
+    it turns per-request f-string assembly into a dict hit and keeps the
+    resulting string interned for the JSON encoder.
+    """
+    style = _STYLE_INSTRUCTIONS[style_key]
+    return (
+        f"You are a patient programming tutor for a learner focused on {focus}. "
+        f"{style} Keep answers under 250 words. If the question drifts far "
+        f"outside {focus}, answer briefly and steer them back to their focus. "
+        "Never invent facts about the learner's progress."
+    )
+
+
+async def _safe_tutor(user_state: UserState, message: str) -> str:
+    """Answer a technical question while staying inside the user's focus."""
+    decision = user_state.decision_state
+    focus = decision.focus[0] if decision and decision.focus else "General Programming"
+
+    evidence = user_state.evidence_profile
+    flags = evidence.flags if evidence else frozenset()
+    # Iterate the small ordered style table against the O(1) flag set so
+    # the chosen style is deterministic.
+    style_key = next((k for k in _STYLE_INSTRUCTIONS if k in flags), None)
+    system_prompt = _system_prompt(focus, style_key)
+
+    return await _openai_chat(
+        MODEL,
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": message},
+        ],
+        temperature=0.3,
+    )
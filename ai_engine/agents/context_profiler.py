@@ -0,0 +1,24 @@
+"""Record the user's practical constraints: time, deadline, limits.
+
+No LLM involved — the onboarding UI collects these as structured fields,
+so this stage is a plain profile write.
+"""
+
+from typing import List, Optional
+
+from ai_engine.models.user_state import ContextProfile, UserState
+
+
+def build_context(
+    user_state: UserState,
+    hours_per_week: int,
+    deadline_months: Optional[int] = None,
+    constraints: Optional[List[str]] = None,
+) -> ContextProfile:
+    profile = ContextProfile(
+        hours_per_week=hours_per_week,
+        deadline_months=deadline_months,
+        constraints=list(constraints) if constraints else [],
+    )
+    user_state.context_profile = profile
+    return profile
@@ -0,0 +1,59 @@
+"""Actionable advice on top of a decision: what to do in the next month.
+
+Where the explanation bot answers "why this plan", ``advise_decision``
+answers "so what should I actually do" — a short, concrete nudge.
+"""
+
+from typing import Dict, Optional
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json as _json
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache, _prompt_common
+from ai_engine.batch_scheduler import SCHEDULER
+from ai_engine.models.user_state import UserState
+
+MODEL = "gpt-4o-mini"
+
+# One short paragraph plus up to two watchouts — mid bin.
+_PREDICTED_TOKENS = 250
+
+_FALLBACK = {
+    "advice": "Spend your next month on your focus path's fundamentals.",
+    "watchouts": [],
+}
+
+
+async def advise_decision(
+    user_state: UserState, *, context_summary: Optional[str] = None
+) -> Dict:
+    decision = user_state.decision_state
+    if decision is None:
+        return dict(_FALLBACK)
+
+    try:
+        raw = await SCHEDULER.submit(
+            lambda: _llm_cache.completion_async(
+                _client.aclient,
+                MODEL,
+                _prompt_common.SYSTEM_PROMPT,
+                _prompt_common.task_prompt(
+                    user_state, "advise", preamble=context_summary
+                ),
+                temperature=0.0,
+                agent="decision_advisor",
+                response_format={"type": "json_object"},
+            ),
+            predicted_tokens=_PREDICTED_TOKENS,
+        )
+        result = _json.loads(raw)
+    except Exception:
+        return dict(_FALLBACK)
+
+    return {
+        "advice": result.get("advice", _FALLBACK["advice"]),
+        "watchouts": result.get("watchouts", []),
+    }
@@ -0,0 +1,115 @@
+"""Fused post-decision tail: advice, roadmap and explanation in one call.
+
+The three post-decision agents consume the same ``user_state`` and have
+no cross-dependencies, so the orchestrator already runs them
+concurrently. ``generate_bundle`` goes one step further and fuses them
+into a single request: one HTTP round trip instead of three, and the
+shared profile tokens are paid for once instead of being resent per
+agent. The standalone agents stay the default — each keeps its own
+cache key and streaming behaviour — and the orchestrator opts in via
+``fuse_tail=True``.
+"""
+
+import asyncio
+from itertools import chain
+from typing import Dict
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json as _json
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache, decision_advisor, explanation_bot, roadmap_generator
+from ai_engine.batch_scheduler import SCHEDULER
+from ai_engine.models.user_state import UserState
+
+MODEL = "gpt-4o-mini"
+
+SYSTEM_PROMPT = (
+    "You produce advice, a roadmap and an explanation for a learner's "
+    "career-path decision in one reply. Input keys: f=focus, p=parked, "
+    "dr=dropped, s=scores, u=urgency, h=weekly hours, w=roadmap weeks, "
+    "d=deadline months, e=evidence flags, i=primary interests, m=market "
+    "context. Output JSON with exactly three keys: "
+    '"advice": {"advice": "...", "watchouts": ["..."]}, '
+    '"roadmap": {"weeks": [{"week": n, "theme": "...", "tasks": ["..."]}], '
+    '"milestone": "..."}, '
+    '"explanation": {"summary": "...", "reasons": ["..."], "tradeoffs": ["..."]}. '
+    "Rules: one concrete 30-day priority; at most two watchouts; scale "
+    "roadmap tasks to h; be honest about weak evidence; no filler."
+)
+
+
+def _predicted_tokens(weeks: int) -> int:
+    # Dominated by the roadmap section; advice + explanation add a
+    # roughly constant tail.
+    return 200 + 110 * weeks
+
+
+def _fallback() -> Dict:
+    return {
+        "advice": dict(decision_advisor._FALLBACK),
+        "roadmap": dict(roadmap_generator._FALLBACK),
+        "explanation": dict(explanation_bot._FALLBACK),
+    }
+
+
+async def generate_bundle(user_state: UserState, weeks: int = 8) -> Dict:
+    """One fused LLM call returning ``{"advice", "roadmap", "explanation"}``.
+
+    Sections missing from the reply (or a failed call) degrade to the
+    same fallbacks the standalone agents use.
+    """
+    decision = user_state.decision_state
+    if decision is None:
+        return _fallback()
+    context = user_state.context_profile
+    evidence = user_state.evidence_profile
+    interest = user_state.interest_profile
+
+    skills_task = asyncio.create_task(
+        asyncio.to_thread(explanation_bot._market_skills)
+    )
+    payload = {
+        "f": decision.focus,
+        "p": decision.park,
+        "dr": decision.drop,
+        "s": decision.scores,
+        "u": decision.urgency,
+        "h": context.hours_per_week if context else 0,
+        "w": weeks,
+        "d": context.deadline_months if context else None,
+        "e": sorted(evidence.flags) if evidence else [],
+        "i": list(interest.primary_interests) if interest else [],
+    }
+    skills = await skills_task
+    payload["m"] = {
+        path: skills[explanation_bot._PATH_TO_SKILL[path]]
+        for path in chain(decision.focus, decision.park, decision.drop)
+        if explanation_bot._PATH_TO_SKILL.get(path) in skills
+    }
+
+    try:
+        raw = await SCHEDULER.submit(
+            lambda: _llm_cache.completion_async(
+                _client.aclient,
+                MODEL,
+                SYSTEM_PROMPT,
+                payload,
+                temperature=0.0,
+                agent="decision_bundle",
+                response_format={"type": "json_object"},
+            ),
+            predicted_tokens=_predicted_tokens(weeks),
+        )
+        result = _json.loads(raw)
+    except Exception:
+        return _fallback()
+
+    fallback = _fallback()
+    return {
+        "advice": result.get("advice") or fallback["advice"],
+        "roadmap": result.get("roadmap") or fallback["roadmap"],
+        "explanation": result.get("explanation") or fallback["explanation"],
+    }
@@ -0,0 +1,208 @@
+"""Rank career paths for a user from interests, evidence and market pull.
+
+``make_decision`` is deterministic: it extracts a numeric feature set from
+the ``UserState``, scores every career path against it, adjusts by the
+market multiplier of each path's headline skills, and partitions the
+paths into focus / park / drop.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Optional
+
+import numpy as np
+
+from ai_engine import _client
+from ai_engine.market_pulse import MarketPulse
+from ai_engine.models.user_state import DecisionState, UserState
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; scoring falls back to NumPy speed
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# Frozen: these are read on every scoring call and must never be
+# mutated at runtime.
+CAREER_PATHS = (
+    "Frontend Engineering",
+    "Backend Engineering",
+    "Data Science / ML",
+    "Competitive Programming",
+)
+
+PATH_DIFFICULTY = MappingProxyType({
+    "Frontend Engineering": 0.2,
+    "Backend Engineering": 0.3,
+    "Data Science / ML": 0.6,
+    "Competitive Programming": 0.4,
+})
+
+PATH_TO_MARKET_SKILLS = MappingProxyType({
+    "Frontend Engineering": ("React", "JavaScript"),
+    "Backend Engineering": ("Python", "SQL"),
+    "Data Science / ML": ("Machine Learning", "Python"),
+    "Competitive Programming": ("Algorithms",),
+})
+
+FEATURE_NAMES = (
+    "development",
+    "problem_solving",
+    "data",
+    "projects",
+    "dsa",
+    "hours",
+)
+
+# One row per CAREER_PATHS entry, one column per FEATURE_NAMES entry.
+# Scoring all paths is then a single matrix-vector product; adding a new
+# path is one extra row instead of another scoring branch.
+WEIGHTS = np.array(
+    [
+        [0.40, 0.00, 0.00, 0.40, 0.00, 0.20],  # Frontend Engineering
+        [0.35, 0.00, 0.00, 0.35, 0.10, 0.20],  # Backend Engineering
+        [0.00, 0.00, 0.50, 0.20, 0.10, 0.20],  # Data Science / ML
+        [0.00, 0.50, 0.00, 0.00, 0.35, 0.15],  # Competitive Programming
+    ],
+    dtype=np.float32,
+)
+
+PENALTY = np.array([PATH_DIFFICULTY[p] for p in CAREER_PATHS], dtype=np.float32)
+
+FOCUS_THRESHOLD = 0.25
+DROP_THRESHOLD = 0.12
+
+# The MarketPulse is a process-wide singleton backed by the shared
+# client; lazily initialized so importing this module stays cheap in
+# tests.
+_market: Optional[MarketPulse] = None
+
+
+def _get_market() -> MarketPulse:
+    global _market
+    if _market is None:
+        _market = MarketPulse(client=_client.client)
+    return _market
+
+
+def extract_features(user_state: UserState) -> np.ndarray:
+    """Flatten the relevant profile fields into a FEATURE_NAMES-ordered vector."""
+    interests = user_state.interest_profile
+    bias = interests.interest_bias if interests else {}
+    evidence = user_state.evidence_profile
+    flags = evidence.flags if evidence else []
+    context = user_state.context_profile
+    hours = context.hours_per_week if context else 0
+
+    return np.array(
+        [
+            bias.get("development", 0.0),
+            bias.get("problem_solving", 0.0),
+            bias.get("data", 0.0),
+            1.0 if "projects_show_real_world_signal" in flags else 0.0,
+            1.0 if "dsa_foundation_built" in flags else 0.0,
+            min(hours / 20.0, 1.0),
+        ],
+        dtype=np.float32,
+    )
+
+
+def score_paths(features: np.ndarray, hours: int) -> np.ndarray:
+    """Score every path at once, penalizing difficulty when time is short."""
+    penalty_factor = 0.6 if hours < 10 else 0.3 if hours < 15 else 0.0
+    scores = WEIGHTS @ features - PENALTY * penalty_factor
+    return np.maximum(scores, 0.0)
+
+
+@njit(cache=True, parallel=True)
+def _score_all(features_2d, hours_1d, weights, penalty):
+    scores = features_2d @ weights.T
+    for i in prange(features_2d.shape[0]):
+        hours = hours_1d[i]
+        factor = 0.6 if hours < 10 else (0.3 if hours < 15 else 0.0)
+        for j in range(scores.shape[1]):
+            adjusted = scores[i, j] - penalty[j] * factor
+            scores[i, j] = adjusted if adjusted > 0.0 else 0.0
+    return scores
+
+
+def score_users_bulk(features_2d: np.ndarray, hours_1d: np.ndarray) -> np.ndarray:
+    """Score a whole batch of users at once: (users, features) -> (users, paths).
+
+    The kernel is JIT-compiled when numba is installed, which is what
+    nightly retro runs over thousands of users want; single-user
+    make_decision keeps the plain NumPy path.
+    """
+    return _score_all(
+        np.ascontiguousarray(features_2d, dtype=np.float32),
+        np.ascontiguousarray(hours_1d, dtype=np.float32),
+        WEIGHTS,
+        PENALTY,
+    )
+
+
+# Every market skill referenced by any path; resolved once per decision.
+_ALL_MARKET_SKILLS = sorted(
+    {s for p in CAREER_PATHS for s in PATH_TO_MARKET_SKILLS[p]}
+)
+
+
+def make_decision(user_state: UserState, max_focus: int = 1) -> DecisionState:
+    market = _get_market()
+    skill_multipliers = {
+        s: market.get_market_multiplier(s) for s in _ALL_MARKET_SKILLS
+    }
+    return _decide(user_state, skill_multipliers, max_focus)
+
+
+async def make_decision_async(user_state: UserState, max_focus: int = 1) -> DecisionState:
+    """Like make_decision, but cold multiplier fetches run concurrently."""
+    market = _get_market()
+    skill_multipliers = await market.get_multipliers(_ALL_MARKET_SKILLS)
+    return _decide(user_state, skill_multipliers, max_focus)
+
+
+def _decide(
+    user_state: UserState,
+    skill_multipliers: Dict[str, float],
+    max_focus: int,
+) -> DecisionState:
+    features = extract_features(user_state)
+    context = user_state.context_profile
+    hours = context.hours_per_week if context else 0
+
+    base_scores = score_paths(features, hours)
+    multipliers = np.array(
+        [
+            sum(skill_multipliers[s] for s in skills) / len(skills)
+            for skills in (PATH_TO_MARKET_SKILLS[p] for p in CAREER_PATHS)
+        ],
+        dtype=np.float32,
+    )
+    final = base_scores * multipliers
+    scores: Dict[str, float] = {
+        path: round(float(final[i]), 4) for i, path in enumerate(CAREER_PATHS)
+    }
+
+    # Only the top max_focus need ordering; everything else partitions by
+    # threshold in a single pass, so no full sort of the score vector.
+    k = min(max_focus, len(CAREER_PATHS))
+    top_idx = np.argpartition(-final, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-final[top_idx])]
+    focus_set = {int(i) for i in top_idx if final[i] >= FOCUS_THRESHOLD}
+
+    focus = [CAREER_PATHS[i] for i in top_idx if int(i) in focus_set]
+    park, drop = [], []
+    for i, path in enumerate(CAREER_PATHS):
+        if i in focus_set:
+            continue
+        (park if final[i] >= DROP_THRESHOLD else drop).append(path)
+
+    urgency = "high" if (context and context.deadline_months and context.deadline_months <= 6) else "normal"
+    decision = DecisionState(focus=focus, park=park, drop=drop, scores=scores, urgency=urgency)
+    user_state.decision_state = decision
+    return decision
@@ -0,0 +1,344 @@
+"""Turn raw GitHub/LeetCode stats into evidence flags for the decision engine.
+
+``build_evidence`` is deterministic on its two input dicts, and user
+stats refresh at most daily, so the pure flag derivation is memoized on
+a frozen digest of the inputs; repeat calls for an unchanged profile are
+a cache lookup rather than a recomputation.
+"""
+
+from datetime import date, datetime
+from enum import IntFlag, auto
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_engine.models.user_state import EvidenceProfile, UserState
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the cascade falls back to bytecode
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+class Tag(IntFlag):
+    """One bit per evidence flag; the string form is the lowercased name.
+
+    Flag emission and the cross-signal checks work purely on the mask,
+    so building a profile costs bitwise ops instead of list appends and
+    O(n) ``in`` scans; the human-readable list is materialized once at
+    the boundary.
+    """
+
+    GITHUB_ACTIVE = auto()
+    EARLY_STAGE_BUILDER = auto()
+    PROJECTS_SHOW_REAL_WORLD_SIGNAL = auto()
+    DSA_FOUNDATION_BUILT = auto()
+    DSA_SATURATION_REACHED = auto()
+    EASY_GRINDING_DETECTED = auto()
+    BALANCED_BUILDER = auto()
+    NEEDS_REAL_WORLD_PROJECTS = auto()
+    DSA_BEGINNER = auto()
+
+THRESHOLDS = MappingProxyType({
+    "MIN_REPOS": 3,
+    "IMPACT_STARS": 10,
+    "DSA_FOUNDATION": 50,
+    "DSA_SATURATION": 300,
+    "EASY_RATIO_MAX": 0.6,
+    "EARLY_STAGE_YEARS": 2.0,
+})
+
+# flag -> feature column emitted by _encode_flags, in vector order.
+TAG_ENCODINGS = MappingProxyType({
+    "github_active": "f_github_active",
+    "early_stage_builder": "f_early_stage",
+    "projects_show_real_world_signal": "f_real_world_projects",
+    "dsa_foundation_built": "f_dsa_foundation",
+    "dsa_saturation_reached": "f_dsa_saturation",
+    "easy_grinding_detected": "f_easy_grinding",
+    "balanced_builder": "f_balanced",
+    "needs_real_world_projects": "f_needs_projects",
+    "dsa_beginner": "f_dsa_beginner",
+})
+
+# (bit, feature column) pairs precomputed from TAG_ENCODINGS so encoding
+# a mask is pure bitwise work.
+_MASK_TO_FEATURE = tuple(
+    (Tag[tag.upper()], feature) for tag, feature in TAG_ENCODINGS.items()
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_created(created_at: str) -> Optional[date]:
+    """Parse a created_at stamp once per distinct value.
+
+    There are only as many distinct stamps as users, so memoizing makes
+    repeat profile builds skip parsing entirely; the cold path uses the
+    C-accelerated ``date.fromisoformat`` with ``strptime`` kept only as
+    a fallback for non-ISO inputs.
+    """
+    try:
+        return date.fromisoformat(created_at[:10])
+    except ValueError:
+        try:
+            return datetime.strptime(created_at[:10], "%Y-%m-%d").date()
+        except ValueError:
+            return None
+
+
+def _calculate_account_age(created_at: Optional[str], now: date) -> float:
+    """Age of a GitHub account in years at ``now``, 0.0 when unknown.
+
+    ``now`` is supplied by the caller so a batch pays for one clock read.
+    """
+    if not created_at:
+        return 0.0
+    created = _parse_created(created_at)
+    if created is None:
+        return 0.0
+    return (now - created).days / 365.25
+
+
+# Account age is bucketed to quarter years before entering the cache
+# key, so near-identical profiles share entries instead of exploding the
+# key space (the cascade only compares age against whole-year limits).
+_AGE_BUCKET_YEARS = 0.25
+
+
+def _bucket_age(age_years: float) -> float:
+    return round(age_years / _AGE_BUCKET_YEARS) * _AGE_BUCKET_YEARS
+
+
+# Plain-int views of the Tag bits and thresholds for the JIT kernel;
+# numba cannot type IntFlag members or a MappingProxyType.
+_B_GITHUB_ACTIVE = int(Tag.GITHUB_ACTIVE)
+_B_EARLY_STAGE = int(Tag.EARLY_STAGE_BUILDER)
+_B_PROJECTS = int(Tag.PROJECTS_SHOW_REAL_WORLD_SIGNAL)
+_B_DSA_FOUNDATION = int(Tag.DSA_FOUNDATION_BUILT)
+_B_DSA_SATURATION = int(Tag.DSA_SATURATION_REACHED)
+_B_EASY_GRINDING = int(Tag.EASY_GRINDING_DETECTED)
+_B_BALANCED = int(Tag.BALANCED_BUILDER)
+_B_NEEDS_PROJECTS = int(Tag.NEEDS_REAL_WORLD_PROJECTS)
+_B_DSA_BEGINNER = int(Tag.DSA_BEGINNER)
+
+_MIN_REPOS = THRESHOLDS["MIN_REPOS"]
+_IMPACT_STARS = THRESHOLDS["IMPACT_STARS"]
+_DSA_FOUNDATION = THRESHOLDS["DSA_FOUNDATION"]
+_DSA_SATURATION = THRESHOLDS["DSA_SATURATION"]
+_EASY_RATIO_MAX = THRESHOLDS["EASY_RATIO_MAX"]
+_EARLY_STAGE_YEARS = THRESHOLDS["EARLY_STAGE_YEARS"]
+
+
+@njit(cache=True)
+def _evaluate(
+    gh_valid: bool,
+    repos: int,
+    stars: int,
+    age_bucket: float,
+    lc_valid: bool,
+    total: int,
+    easy: int,
+) -> int:
+    mask = 0
+
+    if gh_valid:
+        mask |= _B_GITHUB_ACTIVE
+        if repos >= _MIN_REPOS and age_bucket < _EARLY_STAGE_YEARS:
+            mask |= _B_EARLY_STAGE
+        if repos >= _MIN_REPOS and stars >= _IMPACT_STARS:
+            mask |= _B_PROJECTS
+
+    if lc_valid:
+        if total >= _DSA_FOUNDATION:
+            mask |= _B_DSA_FOUNDATION
+        if total >= _DSA_SATURATION:
+            mask |= _B_DSA_SATURATION
+        if total > 0 and easy / total > _EASY_RATIO_MAX:
+            mask |= _B_EASY_GRINDING
+
+    # Cross-signal insights combine both sources.
+    if mask & (_B_PROJECTS | _B_DSA_FOUNDATION) == (_B_PROJECTS | _B_DSA_FOUNDATION):
+        mask |= _B_BALANCED
+    if mask & _B_DSA_SATURATION and not mask & _B_PROJECTS:
+        mask |= _B_NEEDS_PROJECTS
+    if mask & _B_GITHUB_ACTIVE and not mask & _B_DSA_FOUNDATION:
+        mask |= _B_DSA_BEGINNER
+
+    return mask
+
+
+# Pay the JIT cost at import rather than on the first user request.
+_evaluate(True, 0, 0, 0.0, True, 0, 0)
+
+
+@lru_cache(maxsize=4096)
+def _build_flags_and_features(
+    gh_valid: bool,
+    repos: int,
+    stars: int,
+    age_bucket: float,
+    lc_valid: bool,
+    total: int,
+    easy: int,
+) -> Tag:
+    return Tag(_evaluate(gh_valid, repos, stars, age_bucket, lc_valid, total, easy))
+
+
+def _flags_from_mask(mask: Tag) -> Tuple[str, ...]:
+    return tuple(t.name.lower() for t in Tag if mask & t)
+
+
+def _encode_flags(mask: Tag) -> Dict[str, int]:
+    return {feature: int(bool(mask & bit)) for bit, feature in _MASK_TO_FEATURE}
+
+
+def _vector_from_mask(mask: Tag) -> np.ndarray:
+    """Feature vector in _MASK_TO_FEATURE order, ready for a policy dot."""
+    return np.fromiter(
+        (1.0 if mask & bit else 0.0 for bit, _ in _MASK_TO_FEATURE),
+        dtype=np.float32,
+        count=len(_MASK_TO_FEATURE),
+    )
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counters for the evidence cache, for tuning its value.
+
+    If hits stay near zero under real traffic the inputs are too diverse
+    and the cache should be dropped rather than left thrashing.
+    """
+    info = _build_flags_and_features.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def build_evidence(
+    user_state: UserState,
+    github_stats: Optional[Dict],
+    leetcode_stats: Optional[Dict],
+) -> EvidenceProfile:
+    gh = github_stats or {}
+    lc = leetcode_stats or {}
+    today = date.today()
+    account_age = _calculate_account_age(gh.get("created_at"), today)
+
+    mask = _build_flags_and_features(
+        bool(gh.get("valid")),
+        gh.get("repo_count", 0),
+        gh.get("total_stars", 0),
+        _bucket_age(account_age),
+        bool(lc.get("valid")),
+        lc.get("total_solved", 0),
+        lc.get("easy", 0),
+    )
+    profile = EvidenceProfile(
+        github_valid=bool(github_stats and github_stats.get("valid")),
+        leetcode_valid=bool(leetcode_stats and leetcode_stats.get("valid")),
+        flags=frozenset(_flags_from_mask(mask)),
+        feature_vector=_vector_from_mask(mask),
+        account_age_years=round(account_age, 2),
+    )
+    user_state.evidence_profile = profile
+    return profile
+
+
+# Bit value per feature column, for turning a column of masks into a
+# feature matrix with one broadcasted AND.
+_FEATURE_BITS = np.array(
+    [int(bit) for bit, _ in _MASK_TO_FEATURE], dtype=np.int64
+)
+
+
+def _evaluate_batch(
+    gh_valid: np.ndarray,
+    repos: np.ndarray,
+    stars: np.ndarray,
+    age_bucket: np.ndarray,
+    lc_valid: np.ndarray,
+    total: np.ndarray,
+    easy: np.ndarray,
+) -> np.ndarray:
+    """The :func:`_evaluate` cascade over whole columns at once.
+
+    Every rule is one boolean-mask expression, so N users cost a fixed
+    number of vector ops instead of N Python calls. Must stay in
+    lockstep with the scalar kernel.
+    """
+    mask = np.where(gh_valid, _B_GITHUB_ACTIVE, 0)
+    gh_repos = gh_valid & (repos >= _MIN_REPOS)
+    mask |= np.where(gh_repos & (age_bucket < _EARLY_STAGE_YEARS), _B_EARLY_STAGE, 0)
+    mask |= np.where(gh_repos & (stars >= _IMPACT_STARS), _B_PROJECTS, 0)
+
+    mask |= np.where(lc_valid & (total >= _DSA_FOUNDATION), _B_DSA_FOUNDATION, 0)
+    mask |= np.where(lc_valid & (total >= _DSA_SATURATION), _B_DSA_SATURATION, 0)
+    easy_ratio = easy / np.maximum(total, 1)
+    mask |= np.where(
+        lc_valid & (total > 0) & (easy_ratio > _EASY_RATIO_MAX), _B_EASY_GRINDING, 0
+    )
+
+    both = _B_PROJECTS | _B_DSA_FOUNDATION
+    mask |= np.where((mask & both) == both, _B_BALANCED, 0)
+    mask |= np.where(
+        ((mask & _B_DSA_SATURATION) != 0) & ((mask & _B_PROJECTS) == 0),
+        _B_NEEDS_PROJECTS,
+        0,
+    )
+    mask |= np.where(
+        ((mask & _B_GITHUB_ACTIVE) != 0) & ((mask & _B_DSA_FOUNDATION) == 0),
+        _B_DSA_BEGINNER,
+        0,
+    )
+    return mask
+
+
+def build_evidence_batch(
+    user_states: Sequence[UserState],
+    github_stats_list: Sequence[Optional[Dict]],
+    leetcode_stats_list: Sequence[Optional[Dict]],
+) -> List[EvidenceProfile]:
+    """Vectorized :func:`build_evidence` for offline many-user runs.
+
+    Stats are stacked column-wise once, the whole rule table evaluates
+    as array ops, and the feature matrix falls out of one broadcasted
+    bit test. The interactive single-user path is untouched.
+    """
+    n = len(user_states)
+    today = date.today()
+    gh_list = [g or {} for g in github_stats_list]
+    lc_list = [l or {} for l in leetcode_stats_list]
+
+    gh_valid = np.fromiter((bool(g.get("valid")) for g in gh_list), dtype=bool, count=n)
+    repos = np.fromiter((g.get("repo_count", 0) for g in gh_list), dtype=np.int64, count=n)
+    stars = np.fromiter((g.get("total_stars", 0) for g in gh_list), dtype=np.int64, count=n)
+    ages = np.fromiter(
+        (_calculate_account_age(g.get("created_at"), today) for g in gh_list),
+        dtype=np.float64,
+        count=n,
+    )
+    lc_valid = np.fromiter((bool(l.get("valid")) for l in lc_list), dtype=bool, count=n)
+    total = np.fromiter((l.get("total_solved", 0) for l in lc_list), dtype=np.int64, count=n)
+    easy = np.fromiter((l.get("easy", 0) for l in lc_list), dtype=np.int64, count=n)
+
+    # Same quarter-year bucketing as the scalar path, for exact parity
+    # on borderline ages.
+    age_buckets = np.round(ages / _AGE_BUCKET_YEARS) * _AGE_BUCKET_YEARS
+    masks = _evaluate_batch(gh_valid, repos, stars, age_buckets, lc_valid, total, easy)
+    features = ((masks[:, None] & _FEATURE_BITS[None, :]) != 0).astype(np.float32)
+
+    profiles: List[EvidenceProfile] = []
+    for i, state in enumerate(user_states):
+        mask = Tag(int(masks[i]))
+        profile = EvidenceProfile(
+            github_valid=bool(gh_valid[i]),
+            leetcode_valid=bool(lc_valid[i]),
+            flags=frozenset(_flags_from_mask(mask)),
+            feature_vector=features[i],
+            account_age_years=round(float(ages[i]), 2),
+        )
+        state.evidence_profile = profile
+        profiles.append(profile)
+    return profiles
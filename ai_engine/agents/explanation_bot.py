@@ -0,0 +1,103 @@
+"""Explain a decision back to the user in plain language.
+
+``explain_decision`` assembles the user's focus/park/drop split plus the
+market context behind it and asks the LLM for a structured explanation.
+"""
+
+import asyncio
+from itertools import chain
+from typing import Dict, Optional
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json as _json
+
+from cachetools.func import ttl_cache
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache, _prompt_common
+from ai_engine.batch_scheduler import SCHEDULER
+from ai_engine.market_pulse import MarketPulse
+from ai_engine.models.user_state import UserState
+
+MODEL = "gpt-4o-mini"
+
+# A summary sentence and a handful of bullets — short bin.
+_PREDICTED_TOKENS = 150
+
+_PATH_TO_SKILL = {
+    "Frontend Engineering": "React",
+    "Backend Engineering": "Python",
+    "Data Science / ML": "Machine Learning",
+    "Competitive Programming": "Algorithms",
+}
+
+
+# One MarketPulse for the module's lifetime: construction builds the
+# whole MarketState and its caches, which would otherwise be thrown away
+# on every snapshot refresh. No client is passed: the snapshot only
+# reads known skills and must never fall into sync LLM classification.
+_MARKET = MarketPulse()
+
+
+@ttl_cache(maxsize=1, ttl=60)
+def _market_skills() -> Dict:
+    """Snapshot skills, refreshed at most once a minute.
+
+    Adjacent user requests cluster well within the TTL and the market
+    data changes far slower than that, so 99% of explains skip the
+    snapshot entirely.
+    """
+    return _MARKET.snapshot()["skills"]
+
+_FALLBACK = {
+    "summary": "Your plan is based on your interests, evidence and available time.",
+    "reasons": [],
+    "tradeoffs": [],
+}
+
+
+async def explain_decision(
+    user_state: UserState, *, context_summary: Optional[str] = None
+) -> Dict:
+    decision = user_state.decision_state
+    if decision is None:
+        return dict(_FALLBACK)
+
+    skills = await asyncio.to_thread(_market_skills)
+
+    market_context = {
+        path: skills[_PATH_TO_SKILL[path]]
+        for path in chain(decision.focus, decision.park, decision.drop)
+        if _PATH_TO_SKILL.get(path) in skills
+    }
+
+    try:
+        raw = await SCHEDULER.submit(
+            lambda: _llm_cache.completion_async(
+                _client.aclient,
+                MODEL,
+                _prompt_common.SYSTEM_PROMPT,
+                _prompt_common.task_prompt(
+                    user_state,
+                    "explain",
+                    {"m": market_context},
+                    preamble=context_summary,
+                ),
+                temperature=0.0,
+                stream_json=True,
+                agent="explanation_bot",
+                response_format={"type": "json_object"},
+            ),
+            predicted_tokens=_PREDICTED_TOKENS,
+        )
+        result = _json.loads(raw)
+    except Exception:
+        return dict(_FALLBACK)
+
+    return {
+        "summary": result.get("summary", _FALLBACK["summary"]),
+        "reasons": result.get("reasons", []),
+        "tradeoffs": result.get("tradeoffs", []),
+    }
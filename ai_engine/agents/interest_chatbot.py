@@ -0,0 +1,152 @@
+"""Interest discovery: turn free-text onboarding answers into bias scores.
+
+``analyze_interests`` asks the LLM to score the user's answers along the
+three axes the decision engine consumes (development, problem_solving,
+data) and derives a confidence level from the strongest signal. When the
+LLM is unavailable, a precompiled keyword matcher scores the answers
+locally instead of giving up with zeros.
+"""
+
+import json
+import re
+from typing import Dict, List, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick: one-pass multi-pattern matching
+except ImportError:  # optional; the compiled regex below is a drop-in
+    ahocorasick = None
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache
+from ai_engine.models.user_state import Confidence, InterestProfile, UserState
+
+MODEL = "gpt-4o-mini"
+
+DISCOVERY_QUESTIONS = (
+    "Tell me about something you built or made that you were proud of.",
+    "When you get stuck on a hard problem, what do you usually do?",
+    "Do you enjoy digging through data or statistics to answer a question?",
+    "What does a great day of work look like for you?",
+)
+
+# Phrase -> (bucket, weight) for the local scoring fallback. Weights are
+# per-mention and the per-bucket sum is clamped to 1.0, so a couple of
+# strong mentions saturate a bucket the way a confident LLM score would.
+_KEYWORD_TABLE: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "development": (
+        ("built", 0.3), ("build", 0.3), ("app", 0.3), ("website", 0.3),
+        ("project", 0.25), ("code", 0.25), ("coding", 0.25),
+        ("frontend", 0.3), ("backend", 0.3), ("api", 0.25), ("ship", 0.2),
+    ),
+    "problem_solving": (
+        ("debug", 0.3), ("puzzle", 0.3), ("algorithm", 0.3),
+        ("leetcode", 0.35), ("solve", 0.25), ("problem", 0.2),
+        ("figure out", 0.25), ("break it down", 0.3), ("stuck", 0.15),
+    ),
+    "data": (
+        ("data", 0.3), ("statistics", 0.35), ("sql", 0.3), ("chart", 0.25),
+        ("analysis", 0.3), ("analyze", 0.3), ("dataset", 0.35),
+        ("numbers", 0.2), ("spreadsheet", 0.25), ("model", 0.2),
+    ),
+}
+
+_PHRASE_SCORES: Dict[str, Tuple[str, float]] = {
+    phrase: (bucket, weight)
+    for bucket, phrases in _KEYWORD_TABLE.items()
+    for phrase, weight in phrases
+}
+
+# Both matchers are built once at import and shared by every request: a
+# single pass over the text regardless of vocabulary size, versus a
+# `phrase in answer` loop that rescans the text per phrase.
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _phrase, _score in _PHRASE_SCORES.items():
+        _AUTOMATON.add_word(_phrase, (len(_phrase), _score))
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+    _KEYWORD_RE = re.compile(
+        r"\b(?:" + "|".join(
+            re.escape(p) for p in sorted(_PHRASE_SCORES, key=len, reverse=True)
+        ) + r")\b"
+    )
+
+
+def _keyword_signals(answers: List[str]) -> Tuple[float, float, float]:
+    """Score answers from keyword mentions alone, one scan per answer."""
+    bias = {"development": 0.0, "problem_solving": 0.0, "data": 0.0}
+    for answer in answers:
+        text = answer.lower()
+        if _AUTOMATON is not None:
+            for end, (length, (bucket, weight)) in _AUTOMATON.iter(text):
+                # The automaton matches raw substrings; keep word
+                # boundaries so "appetite" does not score as "app".
+                start = end - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text) and text[end + 1].isalnum():
+                    continue
+                bias[bucket] += weight
+        else:
+            for match in _KEYWORD_RE.finditer(text):
+                bucket, weight = _PHRASE_SCORES[match.group(0)]
+                bias[bucket] += weight
+    return (
+        min(bias["development"], 1.0),
+        min(bias["problem_solving"], 1.0),
+        min(bias["data"], 1.0),
+    )
+
+EXTRACT_PROMPT = (
+    "You score a student's interest signals from their answers to "
+    "onboarding questions. Reply with JSON: "
+    '{"development": x, "problem_solving": y, "data": z} where each value '
+    "is 0.0-1.0. Score only from what they actually said."
+)
+
+
+def _extract_interest_signals(answers: List[str]) -> Tuple[float, float, float]:
+    """Return (development, problem_solving, data) scores as a flat tuple."""
+    try:
+        raw = _llm_cache.completion(
+            _client.client,
+            MODEL,
+            EXTRACT_PROMPT,
+            {"answers": answers},
+            temperature=0.0,
+            agent="interest_chatbot",
+            response_format={"type": "json_object"},
+        )
+        parsed = json.loads(raw)
+        return (
+            float(parsed["development"]),
+            float(parsed["problem_solving"]),
+            float(parsed["data"]),
+        )
+    except Exception:
+        # Transport and API failures land here too, not just parse
+        # errors: interests is a fail-fast spine stage, so an LLM outage
+        # must degrade to the keyword scorer rather than kill the run.
+        return _keyword_signals(answers)
+
+
+def analyze_interests(user_state: UserState, answers: List[str]) -> InterestProfile:
+    dev, prob, data = _extract_interest_signals(answers)
+
+    max_signal = dev if dev > prob else prob
+    if data > max_signal:
+        max_signal = data
+    confidence = (
+        Confidence.HIGH
+        if max_signal >= 0.7
+        else (Confidence.LOW if max_signal <= 0.4 else Confidence.MEDIUM)
+    )
+
+    profile = InterestProfile(
+        interest_bias={"development": dev, "problem_solving": prob, "data": data},
+        confidence_level=confidence,
+        raw_answers=list(answers),
+    )
+    user_state.interest_profile = profile
+    return profile
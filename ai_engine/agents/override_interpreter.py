@@ -0,0 +1,142 @@
+"""Interpret a user's request to override their assigned paths.
+
+The user says things like "I really want to do ML" or "drop frontend";
+``interpret_override`` turns that into force_include / force_exclude
+lists restricted to the known career paths. Unambiguous requests — one
+recognizable path, one clear direction — resolve through precompiled
+patterns without an LLM call; everything else goes to the model.
+"""
+
+import json
+import re
+from typing import Dict, Optional
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json as _json
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache
+from ai_engine.agents.decision_engine import CAREER_PATHS
+from ai_engine.batch_scheduler import SCHEDULER
+from ai_engine.models.user_state import UserState
+
+MODEL = "gpt-4o-mini"
+
+# Two short path lists and a one-line note.
+_PREDICTED_TOKENS = 80
+
+ALLOWED_PATHS = list(CAREER_PATHS)
+_VALID_PATHS = frozenset(ALLOWED_PATHS)
+
+# Everything below is compiled once at import and shared by every
+# request, in the same spirit as the chatbot's intent fast paths: one
+# regex pass over the message instead of per-call table construction.
+_PATH_ALIASES = {
+    "Frontend Engineering": ("frontend", "front end", "front-end", "ui work", "react"),
+    "Backend Engineering": ("backend", "back end", "back-end", "server side", "apis"),
+    "Data Science / ML": ("ml", "machine learning", "data science", "data sci"),
+    "Competitive Programming": ("competitive programming", "comp programming"),
+}
+
+# Group names must be identifiers; map a synthetic name per path.
+_GROUP_TO_PATH = {f"p{i}": path for i, path in enumerate(_PATH_ALIASES)}
+_PATH_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>" + "|".join(
+            r"\b" + re.escape(a) + r"\b" for a in aliases
+        ) + ")"
+        for i, aliases in enumerate(_PATH_ALIASES.values())
+    )
+)
+
+_INCLUDE_RE = re.compile(
+    r"\b(want|switch to|focus on|add|go all in|interested in|move to|try)\b"
+)
+_EXCLUDE_RE = re.compile(r"\b(drop|remove|quit|stop|get rid of)\b")
+
+# Negated phrasings ("I don't want frontend anymore") read as include
+# to a bare verb scan — the opposite of the ask. Any negation defers to
+# the model rather than guessing which verb it binds to.
+_NEGATION_RE = re.compile(r"\b(no|not|don'?t|do not|doesn'?t|never|no longer)\b")
+
+
+def _fast_interpret(message: str) -> Optional[Dict]:
+    """Resolve a trivially clear override without the LLM, else None.
+
+    Deliberately conservative: exactly one mentioned path, exactly one
+    direction and no negation, otherwise the model untangles it.
+    """
+    text = message.lower()
+    if _NEGATION_RE.search(text):
+        return None
+    paths = {
+        _GROUP_TO_PATH[name]
+        for match in _PATH_RE.finditer(text)
+        for name, value in match.groupdict().items()
+        if value
+    }
+    if len(paths) != 1:
+        return None
+    include = _INCLUDE_RE.search(text) is not None
+    exclude = _EXCLUDE_RE.search(text) is not None
+    if include == exclude:
+        return None
+    path = paths.pop()
+    if exclude:
+        return {
+            "force_include": [],
+            "force_exclude": [path],
+            "note": f"Excluding {path} as requested.",
+        }
+    return {
+        "force_include": [path],
+        "force_exclude": [],
+        "note": f"Prioritizing {path} as requested.",
+    }
+
+
+SYSTEM_PROMPT = (
+    "You interpret a learner's request to change their career-path plan. "
+    f"The only valid paths are: {json.dumps(ALLOWED_PATHS)}. Reply with "
+    'JSON: {"force_include": [...], "force_exclude": [...], "note": "..."} '
+    "using only valid path names. If the request maps to no valid path, "
+    "return empty lists and explain in note."
+)
+
+
+async def interpret_override(user_state: UserState, message: str) -> Dict:
+    fast = _fast_interpret(message)
+    if fast is not None:
+        return fast
+
+    decision = user_state.decision_state
+    payload = {
+        "message": message,
+        "current_focus": decision.focus if decision else [],
+        "current_drop": decision.drop if decision else [],
+    }
+
+    try:
+        raw = await SCHEDULER.submit(
+            lambda: _llm_cache.completion_async(
+                _client.aclient,
+                MODEL,
+                SYSTEM_PROMPT,
+                payload,
+                temperature=0.0,
+                agent="override_interpreter",
+                response_format={"type": "json_object"},
+            ),
+            predicted_tokens=_PREDICTED_TOKENS,
+        )
+        result = _json.loads(raw)
+    except Exception:
+        return {"force_include": [], "force_exclude": [], "note": "Could not interpret the request."}
+
+    return {
+        "force_include": [p for p in result.get("force_include", []) if p in _VALID_PATHS],
+        "force_exclude": [p for p in result.get("force_exclude", []) if p in _VALID_PATHS],
+        "note": result.get("note", ""),
+    }
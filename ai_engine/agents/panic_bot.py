@@ -0,0 +1,174 @@
+"""Calm a panicking user with grounded, market-aware reassurance.
+
+``handle_panic`` fires when the chatbot routes a message as panic: the
+user is overwhelmed or wants to quit. The reply is generated from their
+actual plan and the market signal behind their focus so the reassurance
+is anchored in evidence rather than platitudes.
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Optional
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json is a drop-in here
+    import json as _json
+
+from ai_engine import _client
+from ai_engine.agents import _llm_cache
+from ai_engine.batch_scheduler import SCHEDULER
+from ai_engine.market_pulse import MarketPulse
+from ai_engine.models.user_state import UserState
+
+logger = logging.getLogger(__name__)
+
+MODEL = "gpt-4o-mini"
+
+# Two short sentences plus a next step — lands in the scheduler's short
+# bin alongside advice.
+_PREDICTED_TOKENS = 120
+
+# Terse on purpose: this prefix is resent on every call, so every token
+# here is paid for per request. Payload keys are abbreviated to match.
+SYSTEM_PROMPT = (
+    "Steady mentor for a panicking learner. Input keys: f=focus path, "
+    "h=weekly hours, u=urgency, mk=market signal for focus, m=message, "
+    "sv=severity (acute|mild). "
+    'Output JSON: {"reply": "...", "next_step": "..."}. Rules: acknowledge '
+    "the feeling; if sv=acute, address the feeling before any plan detail; "
+    "cite concrete evidence from their plan; exactly one "
+    "small next step; never shame; never suggest quitting."
+)
+
+# Compiled once at import: one pass tags messages that signal giving up
+# outright, so the model calibrates tone without being asked to infer
+# severity and the check costs nothing per call.
+_ACUTE_RE = re.compile(
+    r"\b(quit|giv(e|ing) up|hopeless|pointless|waste of time|"
+    r"can'?t do (this|it)|not (good|smart) enough)\b"
+)
+
+# One MarketPulse for the module's lifetime: constructing one per call
+# would rebuild MarketState (13 signal allocations plus a datetime
+# format) and throw away the classification cache between users. Built
+# lazily (same pattern as decision_engine._get_market) so importing the
+# module never constructs the LLM client.
+_market_pulse: Optional[MarketPulse] = None
+
+
+def _get_market_pulse() -> MarketPulse:
+    global _market_pulse
+    if _market_pulse is None:
+        _market_pulse = MarketPulse(client=_client.client)
+    return _market_pulse
+
+# Frozen: read on every panic call and must never be mutated at runtime.
+_FOCUS_SKILL_MAP = MappingProxyType({
+    "Frontend Engineering": "React",
+    "Backend Engineering": "Python",
+    "Data Science / ML": "Machine Learning",
+    "Competitive Programming": "Algorithms",
+})
+
+@lru_cache(maxsize=None)
+def _market_info(skill: str) -> Dict:
+    """Market context for one skill; constant per process since the
+    snapshot is static, so each focus skill is looked up exactly once."""
+    return _get_market_pulse().snapshot()["skills"].get(skill, {})
+
+
+_FALLBACK = {
+    "reply": (
+        "It's normal for this to feel heavy. Your plan hasn't changed, "
+        "and neither has the progress you've already made."
+    ),
+    "next_step": "Pick the smallest task on your roadmap and finish just that one today.",
+}
+
+
+def _panic_payload(user_state: UserState, message: str) -> Dict:
+    decision = user_state.decision_state
+    focus = decision.focus[0] if decision and decision.focus else None
+    context = user_state.context_profile
+
+    skill = _FOCUS_SKILL_MAP.get(focus)
+    market_info = _market_info(skill) if skill else {}
+
+    return {
+        "f": focus,
+        "h": context.hours_per_week if context else 0,
+        "u": decision.urgency if decision else "normal",
+        "mk": market_info,
+        "m": message,
+        "sv": "acute" if _ACUTE_RE.search(message.lower()) else "mild",
+    }
+
+
+async def handle_panic(user_state: UserState, message: str) -> Dict:
+    """Produce a reassuring, evidence-backed reply to a panic message."""
+    payload = _panic_payload(user_state, message)
+    try:
+        raw = await SCHEDULER.submit(
+            lambda: _llm_cache.completion_async(
+                _client.aclient,
+                MODEL,
+                SYSTEM_PROMPT,
+                payload,
+                temperature=0.0,
+                agent="panic_bot",
+                response_format={"type": "json_object"},
+            ),
+            predicted_tokens=_PREDICTED_TOKENS,
+        )
+        result = _json.loads(raw)
+    except Exception:
+        return dict(_FALLBACK)
+
+    return {
+        "reply": result.get("reply", _FALLBACK["reply"]),
+        "next_step": result.get("next_step", _FALLBACK["next_step"]),
+    }
+
+
+async def handle_panic_stream(
+    user_state: UserState, message: str
+) -> AsyncIterator[str]:
+    """Stream the raw panic response as it is generated.
+
+    Chunks are forwarded as they arrive (for SSE endpoints), so the user
+    sees the first words at first-token latency instead of waiting for
+    the whole generation. The concatenated response is parsed once at
+    the end for logging; on any failure the fallback is yielded whole as
+    a single JSON chunk.
+    """
+    payload = _panic_payload(user_state, message)
+    try:
+        response = await _client.aclient.chat.completions.create(
+            model=MODEL,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(payload, sort_keys=True)},
+            ],
+            temperature=0,
+            stream=True,
+            response_format={"type": "json_object"},
+        )
+        parts = []
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content or ""
+            if delta:
+                parts.append(delta)
+                yield delta
+    except Exception:
+        yield json.dumps(_FALLBACK)
+        return
+
+    try:
+        result = _json.loads("".join(parts))
+        logger.debug("panic stream completed: %s", result.get("next_step"))
+    except ValueError:
+        logger.warning("panic stream produced unparseable JSON")
@@ -0,0 +1,88 @@
+"""Length-aware dispatch of outbound LLM calls.
+
+Under concurrent load the agents emit requests with very different
+expected response lengths (roadmap >> advice >> explanation). Server-side
+continuous batching co-schedules whatever arrives together, so mixing a
+long generation into a batch of short ones makes the short ones wait.
+``BatchScheduler`` holds outbound calls for a small window
+(``max_wait``, 20ms — noise next to LLM RTT), groups them into bins by
+predicted response tokens, and releases each bin as one concurrent
+burst, so like-sized generations reach the server together and finish
+uniformly.
+
+Single-loop, fire-and-collect: ``submit`` returns when the underlying
+call resolves. With one caller in flight the only cost is the wait
+window.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+# (bin name, exclusive upper bound on predicted response tokens).
+_BINS = (("short", 200), ("mid", 800), ("long", 2000))
+
+_Pending = Tuple[Callable[[], Awaitable[Any]], "asyncio.Future[Any]"]
+
+
+class BatchScheduler:
+    def __init__(self, *, max_wait: float = 0.02, max_batch: int = 16) -> None:
+        self._max_wait = max_wait
+        self._max_batch = max_batch
+        self._bins: Dict[str, List[_Pending]] = {name: [] for name, _ in _BINS}
+        self._flusher: "asyncio.Task[None] | None" = None
+
+    @staticmethod
+    def bin_for(predicted_tokens: int) -> str:
+        for name, bound in _BINS:
+            if predicted_tokens < bound:
+                return name
+        return _BINS[-1][0]
+
+    async def submit(
+        self,
+        coro_factory: Callable[[], Awaitable[Any]],
+        *,
+        predicted_tokens: int,
+    ) -> Any:
+        """Queue a call into its length bin and await its result.
+
+        A bin that fills to ``max_batch`` is released immediately —
+        under heavy load the window never adds latency, it only exists
+        to give sparse traffic a chance to coalesce.
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+        name = self.bin_for(predicted_tokens)
+        queue = self._bins[name]
+        queue.append((coro_factory, future))
+        if len(queue) >= self._max_batch:
+            self._bins[name] = []
+            loop.create_task(self._dispatch(queue))
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self._max_wait)
+        for name in self._bins:
+            batch, self._bins[name] = self._bins[name], []
+            if batch:
+                asyncio.get_running_loop().create_task(self._dispatch(batch))
+
+    @staticmethod
+    async def _dispatch(batch: List[_Pending]) -> None:
+        outcomes = await asyncio.gather(
+            *(factory() for factory, _ in batch), return_exceptions=True
+        )
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.cancelled():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+# Shared instance: binning only helps if every agent routes through the
+# same window.
+SCHEDULER = BatchScheduler()
@@ -0,0 +1,59 @@
+"""Consecutive-failure circuit breaker for pipeline stages.
+
+When an upstream (an LLM endpoint, a scraper target) is down, every
+request pays the full timeout before failing. A tripped breaker fails
+those calls instantly instead, and after a cooldown lets probes through
+to detect recovery. One breaker per stage name; state is per-process.
+"""
+
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures.
+
+    While open, :meth:`allow` returns False until ``cooldown`` seconds
+    have passed; then calls are let through again (half-open) and the
+    first success closes the breaker, while a failure restarts the
+    cooldown.
+    """
+
+    def __init__(
+        self, name: str, *, threshold: int = 5, cooldown: float = 30.0
+    ) -> None:
+        self.name = name
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at >= self._cooldown:
+            logger.info("circuit %s half-open, probing", self.name)
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("circuit %s closed", self.name)
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None:
+            # Failed probe: restart the cooldown window.
+            self._opened_at = time.monotonic()
+        elif self._failures >= self._threshold:
+            logger.warning(
+                "circuit %s open after %d consecutive failures",
+                self.name,
+                self._failures,
+            )
+            self._opened_at = time.monotonic()
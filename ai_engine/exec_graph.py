@@ -0,0 +1,160 @@
+"""Tiny in-process DAG scheduler for pipeline stages.
+
+``Graph`` runs named steps as soon as all their dependencies have
+finished, so sibling stages execute concurrently without the pipeline
+hand-coding every gather. Async callables run on the loop; sync
+callables are pushed to a thread. Each step may declare a timeout, and
+with ``continue_on_error`` a failed step marks its dependents skipped
+instead of aborting the whole run.
+"""
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
+
+
+class CycleError(ValueError):
+    """The declared dependencies contain a cycle."""
+
+
+class StepFailed(RuntimeError):
+    """A step raised (or timed out) and continue_on_error is off."""
+
+    def __init__(self, name: str, cause: BaseException) -> None:
+        super().__init__(f"step {name!r} failed: {cause!r}")
+        self.name = name
+        self.cause = cause
+
+
+@dataclass(slots=True)
+class _Step:
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...]
+    timeout: Optional[float]
+
+
+class Graph:
+    """A dependency graph of steps, executed level-free by readiness.
+
+    Steps receive the outputs of their dependencies as keyword
+    arguments named after the dependency; ordering-only deps can simply
+    accept and ignore them (or use closures over shared state).
+    """
+
+    def __init__(self, *, continue_on_error: bool = False) -> None:
+        self._steps: Dict[str, _Step] = {}
+        self.continue_on_error = continue_on_error
+        self.errors: Dict[str, BaseException] = {}
+        self.skipped: set = set()
+
+    def add_step(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        deps: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ) -> "Graph":
+        if name in self._steps:
+            raise ValueError(f"duplicate step {name!r}")
+        self._steps[name] = _Step(name, fn, tuple(deps), timeout)
+        return self
+
+    def _validate(self) -> None:
+        for step in self._steps.values():
+            for dep in step.deps:
+                if dep not in self._steps:
+                    raise ValueError(
+                        f"step {step.name!r} depends on unknown {dep!r}"
+                    )
+        # Three-color DFS cycle check.
+        WHITE, GREY, BLACK = 0, 1, 2
+        color = dict.fromkeys(self._steps, WHITE)
+
+        def visit(name: str) -> None:
+            color[name] = GREY
+            for dep in self._steps[name].deps:
+                if color[dep] == GREY:
+                    raise CycleError(f"cycle through {dep!r}")
+                if color[dep] == WHITE:
+                    visit(dep)
+            color[name] = BLACK
+
+        for name in self._steps:
+            if color[name] == WHITE:
+                visit(name)
+
+    async def _run_step(self, step: _Step, results: Dict[str, Any]) -> Any:
+        kwargs = {dep: results[dep] for dep in step.deps}
+        if inspect.iscoroutinefunction(step.fn):
+            coro = step.fn(**kwargs)
+        else:
+            coro = asyncio.to_thread(step.fn, **kwargs)
+        if step.timeout is not None:
+            return await asyncio.wait_for(coro, step.timeout)
+        return await coro
+
+    async def run_iter(self) -> AsyncIterator[Tuple[str, Any]]:
+        """Execute the graph, yielding ``(name, output)`` per finished step.
+
+        Steps are yielded in completion order, so consumers can stream
+        partial results while slower siblings are still running. Failed
+        and skipped steps are not yielded (inspect ``errors`` and
+        ``skipped``).
+        """
+        self._validate()
+        self.errors.clear()
+        self.skipped.clear()
+        results: Dict[str, Any] = {}
+        pending = dict(self._steps)
+        dead: set = set()
+        running: Dict["asyncio.Task[Any]", _Step] = {}
+
+        def schedule() -> None:
+            # Repeat until stable: marking a step dead can cascade to
+            # transitive dependents within one pass.
+            changed = True
+            while changed:
+                changed = False
+                for step in list(pending.values()):
+                    if any(dep in dead for dep in step.deps):
+                        del pending[step.name]
+                        dead.add(step.name)
+                        self.skipped.add(step.name)
+                        changed = True
+                    elif all(dep in results for dep in step.deps):
+                        del pending[step.name]
+                        task = asyncio.create_task(self._run_step(step, results))
+                        running[task] = step
+
+        schedule()
+        while running:
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                step = running.pop(task)
+                exc = task.exception()
+                if exc is not None:
+                    if not self.continue_on_error:
+                        for other in running:
+                            other.cancel()
+                        raise StepFailed(step.name, exc) from exc
+                    self.errors[step.name] = exc
+                    dead.add(step.name)
+                else:
+                    results[step.name] = task.result()
+                    yield step.name, task.result()
+            schedule()
+
+    async def run(self) -> Dict[str, Any]:
+        """Execute every step; returns ``{step name: output}``.
+
+        Outputs of failed or skipped steps are absent from the result
+        (inspect ``errors`` and ``skipped``).
+        """
+        results: Dict[str, Any] = {}
+        async for name, value in self.run_iter():
+            results[name] = value
+        return results
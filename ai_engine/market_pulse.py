@@ -0,0 +1,299 @@
+"""Market signal lookups backing decision scoring and agent prompts.
+
+``MarketState`` is a static in-process snapshot of job-market signals per
+skill; ``MarketPulse`` turns those signals into score multipliers and
+falls back to an LLM classification for skills it has never seen.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+import numpy as np
+from cachetools import TTLCache
+
+try:
+    from diskcache import Cache as _DiskCache
+except ImportError:  # diskcache is optional; fall back to in-memory TTL
+    _DiskCache = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel falls back to bytecode
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# Frozen views: read-only reference data that must never drift from the
+# table forms the kernel uses below.
+TREND_MULTIPLIERS = MappingProxyType(
+    {"rising": 1.1, "stable": 1.0, "declining": 0.9}
+)
+SATURATION_PENALTIES = MappingProxyType(
+    {"low": 0.1, "medium": 0.0, "high": -0.15}
+)
+
+# Table forms of the dicts above for the numeric kernel: index 0/1/2 is
+# rising/stable/declining and low/medium/high respectively.
+_TREND_TABLE = np.array([1.1, 1.0, 0.9], dtype=np.float64)
+_SAT_TABLE = np.array([0.1, 0.0, -0.15], dtype=np.float64)
+_SAT_CODES = {"low": 0, "medium": 1, "high": 2}
+_TREND_NAMES = ("rising", "stable", "declining")
+
+
+@njit(cache=True)
+def _score(jobs: int, prev: int, sat_code: int) -> float:
+    if prev == 0:
+        trend = 0
+    else:
+        delta = (jobs - prev) / prev
+        trend = 0 if delta >= 0.15 else (2 if delta <= -0.15 else 1)
+    return _TREND_TABLE[trend] + _SAT_TABLE[sat_code]
+
+
+# Compile at import so the first request never pays JIT latency.
+_score(0, 0, 0)
+
+_CLASSIFY_MODEL = "gpt-4o-mini"
+# On-disk entries live longer than the in-memory day: restarts shouldn't
+# re-spend tokens, but trends should refresh eventually.
+_DISK_TTL = 30 * 86400
+_DISK_CACHE_DIR = os.path.expanduser("~/.figureit/market_cache")
+
+def _norm(skill: str) -> str:
+    """Cache key for a user-typed skill: casing/whitespace variants of
+    the same skill must hit the same entry."""
+    return skill.strip().casefold()
+
+
+CLASSIFY_PROMPT = (
+    "You estimate demand for a software skill. Given the skill name, reply "
+    'with JSON {"multiplier": x} where x is between 0.7 (dead market) and '
+    "1.3 (booming market). Unknown or made-up skills get 1.0."
+)
+
+
+# (skill, jobs, previous_jobs, blog_mentions, saturation)
+_SEED = (
+    ("Python", 12000, 10500, 340, "medium"),
+    ("JavaScript", 11000, 11200, 280, "high"),
+    ("TypeScript", 8000, 6900, 210, "medium"),
+    ("React", 9500, 8800, 260, "high"),
+    ("Node.js", 7000, 6800, 150, "medium"),
+    ("Java", 9000, 9100, 120, "high"),
+    ("Go", 4200, 3400, 140, "low"),
+    ("Rust", 2600, 1900, 160, "low"),
+    ("SQL", 10000, 9800, 90, "medium"),
+    ("Machine Learning", 7600, 6100, 420, "medium"),
+    ("Data Engineering", 5200, 4300, 180, "low"),
+    ("DevOps", 6100, 5700, 170, "medium"),
+    ("Algorithms", 3000, 3000, 80, "high"),
+)
+
+_SAT_NAMES = ("low", "medium", "high")
+
+
+class MarketState:
+    """Static snapshot of the skill market the engine reasons over.
+
+    Stored column-wise (struct-of-arrays): every numeric field lives in
+    one contiguous ndarray indexed by skill position, so whole-market
+    passes (trends, multipliers) run as vector ops instead of touching
+    one Python object per skill. ``name_to_idx`` maps a skill name to
+    its row.
+    """
+
+    def __init__(self) -> None:
+        self.generated_at = datetime.utcnow().isoformat()
+        self.names = [row[0] for row in _SEED]
+        self.name_to_idx: Dict[str, int] = {
+            name: i for i, name in enumerate(self.names)
+        }
+        # Skill strings are user-typed; index by normalized form too so
+        # "python" / " Python " resolve to the same row.
+        self.norm_to_idx: Dict[str, int] = {
+            name.casefold(): i for i, name in enumerate(self.names)
+        }
+        self.jobs = np.array([row[1] for row in _SEED], dtype=np.int32)
+        self.prev_jobs = np.array([row[2] for row in _SEED], dtype=np.int32)
+        self.blogs = np.array([row[3] for row in _SEED], dtype=np.int32)
+        self.sat_codes = np.array(
+            [_SAT_CODES[row[4]] for row in _SEED], dtype=np.int8
+        )
+
+
+class MarketPulse:
+    def __init__(self, client: Optional[Any] = None) -> None:
+        self.client = client
+        self.state = MarketState()
+        # LLM classifications for skills outside MarketState. Backed by
+        # diskcache when available so warm classifications survive
+        # restarts and are shared between workers; otherwise an
+        # in-memory TTL so stale verdicts get re-asked after a day.
+        if _DiskCache is not None:
+            self._cache: Any = _DiskCache(
+                _DISK_CACHE_DIR, size_limit=64 * 1024 * 1024
+            )
+            self._cache_expire: Optional[int] = _DISK_TTL
+        else:
+            self._cache = TTLCache(maxsize=1024, ttl=86400)
+            self._cache_expire = None
+        # Guards _cache: cold classifications run in worker threads and
+        # TTLCache mutation is not thread-safe (diskcache is, but the
+        # lock is cheap enough to share the code path).
+        self._cache_lock = threading.Lock()
+        # Resolved multipliers for any skill ever asked for: the same
+        # handful of skills ("Python", "React", ...) recur across every
+        # path of every user, so each is computed exactly once per
+        # process. An explicit dict rather than lru_cache because the
+        # method is bound and the key space is tiny.
+        self._multiplier_cache: Dict[str, float] = {}
+        # Memoized snapshot(): MarketState never mutates in-process, so
+        # the dict is built once. Any future mutator must reset this to
+        # None.
+        self._snapshot_cache: Optional[Dict[str, Any]] = None
+
+    def _trends_vec(self) -> np.ndarray:
+        """Trend codes (0=rising, 1=stable, 2=declining) for every skill
+        in one vectorized pass over the columnar jobs arrays."""
+        jobs = self.state.jobs
+        prev = self.state.prev_jobs
+        delta = (jobs - prev) / np.where(prev == 0, 1, prev)
+        return np.select(
+            [prev == 0, delta >= 0.15, delta <= -0.15], [0, 0, 2], default=1
+        )
+
+    def _known_skill_multiplier(self, idx: int) -> float:
+        state = self.state
+        return float(
+            _score(
+                int(state.jobs[idx]),
+                int(state.prev_jobs[idx]),
+                int(state.sat_codes[idx]),
+            )
+        )
+
+    @staticmethod
+    def _cache_key(skill: str) -> str:
+        # Model name in the key so switching models invalidates verdicts.
+        return f"{_CLASSIFY_MODEL}:{_norm(skill)}"
+
+    def _cache_get(self, skill: str) -> Optional[float]:
+        with self._cache_lock:
+            return self._cache.get(self._cache_key(skill))
+
+    def _cache_put(self, skill: str, multiplier: float) -> None:
+        key = self._cache_key(skill)
+        with self._cache_lock:
+            if self._cache_expire is not None:
+                self._cache.set(key, multiplier, expire=self._cache_expire)
+            else:
+                self._cache[key] = multiplier
+
+    def _classify_unknown_skill(self, skill: str) -> float:
+        cached = self._cache_get(skill)
+        if cached is not None:
+            return cached
+        if self.client is None:
+            return 1.0
+        try:
+            response = self.client.chat.completions.create(
+                model=_CLASSIFY_MODEL,
+                messages=[
+                    {"role": "system", "content": CLASSIFY_PROMPT},
+                    {"role": "user", "content": skill},
+                ],
+                temperature=0,
+                response_format={"type": "json_object"},
+            )
+            multiplier = float(json.loads(response.choices[0].message.content)["multiplier"])
+        except Exception:
+            multiplier = 1.0
+        multiplier = min(1.3, max(0.7, multiplier))
+        self._cache_put(skill, multiplier)
+        return multiplier
+
+    def get_market_multiplier(self, skill: str) -> float:
+        key = _norm(skill)
+        multiplier = self._multiplier_cache.get(key)
+        if multiplier is not None:
+            return multiplier
+        idx = self.state.norm_to_idx.get(key)
+        if idx is not None:
+            multiplier = self._known_skill_multiplier(idx)
+            self._multiplier_cache[key] = multiplier
+            return multiplier
+        # Unknown skills stay out of _multiplier_cache so the TTL on the
+        # classification cache actually expires them.
+        return self._classify_unknown_skill(skill)
+
+    async def get_market_multiplier_async(self, skill: str) -> float:
+        """Async variant: warm and known skills resolve inline, cold
+        classifications run in a thread so they never block the loop."""
+        key = _norm(skill)
+        if (
+            key in self._multiplier_cache
+            or key in self.state.norm_to_idx
+            or self._cache_get(skill) is not None
+        ):
+            return self.get_market_multiplier(skill)
+        return await asyncio.to_thread(self.get_market_multiplier, skill)
+
+    async def get_multipliers(self, skills: "list[str]") -> Dict[str, float]:
+        """Resolve many skills at once, overlapping cold LLM classifications.
+
+        Cached and known skills resolve inline; unknown-uncached skills
+        each cost a blocking LLM call, so those run concurrently in
+        threads and the phase costs max(latency) instead of the sum.
+        """
+        resolved: Dict[str, float] = {}
+        cold: "list[str]" = []
+        for skill in skills:
+            key = _norm(skill)
+            if (
+                key in self._multiplier_cache
+                or key in self.state.norm_to_idx
+                or self._cache_get(skill) is not None
+            ):
+                resolved[skill] = self.get_market_multiplier(skill)
+            else:
+                cold.append(skill)
+        if cold:
+            values = await asyncio.gather(
+                *(asyncio.to_thread(self.get_market_multiplier, s) for s in cold)
+            )
+            resolved.update(zip(cold, values))
+        return resolved
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full market view keyed by skill, as fed into agent prompts.
+
+        Built once and returned by reference afterwards; callers must
+        treat it as read-only.
+        """
+        if self._snapshot_cache is not None:
+            return self._snapshot_cache
+        state = self.state
+        trends = self._trends_vec()
+        multipliers = [self.get_market_multiplier(name) for name in state.names]
+        self._snapshot_cache = {
+            "generated_at": state.generated_at,
+            "skills": {
+                name: {
+                    "jobs": int(jobs),
+                    "trend": _TREND_NAMES[trend],
+                    "saturation": _SAT_NAMES[sat],
+                    "multiplier": multiplier,
+                }
+                for name, jobs, trend, sat, multiplier in zip(
+                    state.names, state.jobs, trends, state.sat_codes, multipliers
+                )
+            },
+        }
+        return self._snapshot_cache
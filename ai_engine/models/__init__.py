@@ -0,0 +1,29 @@
+from ai_engine.models.serde import (
+    decode_user_state,
+    encode_user_state,
+    user_state_from_dict,
+)
+from ai_engine.models.user_state import (
+    BasicProfile,
+    BehaviorLog,
+    Confidence,
+    ContextProfile,
+    DecisionState,
+    EvidenceProfile,
+    InterestProfile,
+    UserState,
+)
+
+__all__ = [
+    "BasicProfile",
+    "BehaviorLog",
+    "Confidence",
+    "ContextProfile",
+    "DecisionState",
+    "EvidenceProfile",
+    "InterestProfile",
+    "UserState",
+    "decode_user_state",
+    "encode_user_state",
+    "user_state_from_dict",
+]
@@ -0,0 +1,102 @@
+"""Fast ``UserState`` (de)serialization for persistence and hand-off.
+
+In-process the pipeline passes ``UserState`` objects by reference, so
+nothing is encoded between agents and there is no per-hop cost to
+remove. This module covers the edges where a state does cross a
+boundary — snapshots, caches, worker hand-off: encode goes through the
+model's single-pass :meth:`~ai_engine.models.user_state.UserState.to_dict`
+and the fastest JSON codec available; decode rebuilds the slots
+dataclasses directly, restoring the non-JSON field types (enum,
+frozenset, float32 ndarray, datetime) the wire format flattens.
+
+msgspec is preferred when installed, then orjson, then stdlib json —
+same optional-import ladder as the rest of the engine.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Union
+
+import numpy as np
+
+try:
+    import msgspec
+
+    _encode = msgspec.json.encode
+    _decode = msgspec.json.decode
+except ImportError:  # msgspec is optional; orjson/json are drop-ins here
+    try:
+        import orjson
+
+        _encode = orjson.dumps
+        _decode = orjson.loads
+    except ImportError:
+        import json
+
+        def _encode(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+        _decode = json.loads
+
+from ai_engine.models.user_state import (
+    BasicProfile,
+    BehaviorLog,
+    Confidence,
+    ContextProfile,
+    DecisionState,
+    EvidenceProfile,
+    InterestProfile,
+    UserState,
+)
+
+
+def encode_user_state(user_state: UserState) -> bytes:
+    """Serialize a state to JSON bytes."""
+    return _encode(user_state.to_dict())
+
+
+def decode_user_state(buf: Union[bytes, str]) -> UserState:
+    """Rebuild a state from :func:`encode_user_state` output."""
+    return user_state_from_dict(_decode(buf))
+
+
+def user_state_from_dict(data: Dict[str, Any]) -> UserState:
+    """Inverse of ``UserState.to_dict``."""
+    interest = data.get("interest_profile")
+    context = data.get("context_profile")
+    evidence = data.get("evidence_profile")
+    decision = data.get("decision_state")
+    behavior = data.get("behavior_log") or {}
+    last_active = behavior.get("last_active")
+    return UserState(
+        user_id=data["user_id"],
+        basic_profile=BasicProfile(**(data.get("basic_profile") or {})),
+        interest_profile=None
+        if interest is None
+        else InterestProfile(
+            interest_bias=dict(interest["interest_bias"]),
+            confidence_level=Confidence(interest["confidence_level"]),
+            raw_answers=list(interest["raw_answers"]),
+        ),
+        context_profile=None if context is None else ContextProfile(**context),
+        evidence_profile=None
+        if evidence is None
+        else EvidenceProfile(
+            github_valid=evidence["github_valid"],
+            leetcode_valid=evidence["leetcode_valid"],
+            flags=frozenset(evidence["flags"]),
+            feature_vector=np.asarray(
+                evidence["feature_vector"], dtype=np.float32
+            ),
+            account_age_years=evidence["account_age_years"],
+        ),
+        decision_state=None if decision is None else DecisionState(**decision),
+        behavior_log=BehaviorLog(
+            messages_sent=behavior.get("messages_sent", 0),
+            panic_events=behavior.get("panic_events", 0),
+            overrides_requested=behavior.get("overrides_requested", 0),
+            last_active=datetime.fromisoformat(last_active)
+            if last_active
+            else None,
+        ),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
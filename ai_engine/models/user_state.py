@@ -0,0 +1,167 @@
+"""Core user state passed between every FigureIt agent.
+
+A ``UserState`` is built incrementally by the pipeline: the context
+profiler fills ``context_profile``, the interest chatbot fills
+``interest_profile``, the evidence profiler fills ``evidence_profile``
+and the decision engine fills ``decision_state``.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+
+class Confidence(str, Enum):
+    __slots__ = ()
+
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+@dataclass(slots=True)
+class BasicProfile:
+    name: str = ""
+    education_level: str = ""
+    year_of_study: Optional[int] = None
+    goal: str = ""
+
+
+@dataclass(slots=True)
+class InterestProfile:
+    interest_bias: Dict[str, float] = field(default_factory=dict)
+    confidence_level: Confidence = Confidence.LOW
+    raw_answers: List[str] = field(default_factory=list)
+    # Lazily computed by primary_interests; a plain slot rather than
+    # cached_property because slots classes have no instance __dict__.
+    _primary: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def primary_interests(self) -> Tuple[str, ...]:
+        """Interest axes scoring >= 0.5, computed once per profile."""
+        if self._primary is None:
+            self._primary = tuple(
+                k for k, v in self.interest_bias.items() if v >= 0.5
+            )
+        return self._primary
+
+
+@dataclass(slots=True)
+class ContextProfile:
+    hours_per_week: int = 0
+    deadline_months: Optional[int] = None
+    constraints: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class EvidenceProfile:
+    github_valid: bool = False
+    leetcode_valid: bool = False
+    # frozenset so downstream membership checks are O(1) and the flags
+    # can never drift after the profile is built.
+    flags: FrozenSet[str] = field(default_factory=frozenset)
+    # float32 ndarray so any downstream scorer can dot it against a
+    # policy vector without converting per user.
+    feature_vector: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.float32)
+    )
+    account_age_years: float = 0.0
+
+
+@dataclass(slots=True)
+class DecisionState:
+    focus: List[str] = field(default_factory=list)
+    park: List[str] = field(default_factory=list)
+    drop: List[str] = field(default_factory=list)
+    scores: Dict[str, float] = field(default_factory=dict)
+    urgency: str = "normal"
+
+
+@dataclass(slots=True)
+class BehaviorLog:
+    messages_sent: int = 0
+    panic_events: int = 0
+    overrides_requested: int = 0
+    last_active: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class UserState:
+    user_id: str
+    basic_profile: BasicProfile = field(default_factory=BasicProfile)
+    interest_profile: Optional[InterestProfile] = None
+    context_profile: Optional[ContextProfile] = None
+    evidence_profile: Optional[EvidenceProfile] = None
+    decision_state: Optional[DecisionState] = None
+    behavior_log: BehaviorLog = field(default_factory=BehaviorLog)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to JSON-ready primitives in one explicit pass.
+
+        Hand-rolled rather than ``dataclasses.asdict``: asdict deepcopies
+        every field recursively and still leaks datetime/Enum/ndarray
+        objects into the result. This walks each sub-profile once and
+        emits only encodable values.
+        """
+        basic = self.basic_profile
+        interest = self.interest_profile
+        context = self.context_profile
+        evidence = self.evidence_profile
+        decision = self.decision_state
+        behavior = self.behavior_log
+        return {
+            "user_id": self.user_id,
+            "basic_profile": {
+                "name": basic.name,
+                "education_level": basic.education_level,
+                "year_of_study": basic.year_of_study,
+                "goal": basic.goal,
+            },
+            "interest_profile": None
+            if interest is None
+            else {
+                "interest_bias": dict(interest.interest_bias),
+                "confidence_level": interest.confidence_level.value,
+                "raw_answers": list(interest.raw_answers),
+            },
+            "context_profile": None
+            if context is None
+            else {
+                "hours_per_week": context.hours_per_week,
+                "deadline_months": context.deadline_months,
+                "constraints": list(context.constraints),
+            },
+            "evidence_profile": None
+            if evidence is None
+            else {
+                "github_valid": evidence.github_valid,
+                "leetcode_valid": evidence.leetcode_valid,
+                "flags": sorted(evidence.flags),
+                "feature_vector": evidence.feature_vector.tolist(),
+                "account_age_years": evidence.account_age_years,
+            },
+            "decision_state": None
+            if decision is None
+            else {
+                "focus": list(decision.focus),
+                "park": list(decision.park),
+                "drop": list(decision.drop),
+                "scores": dict(decision.scores),
+                "urgency": decision.urgency,
+            },
+            "behavior_log": {
+                "messages_sent": behavior.messages_sent,
+                "panic_events": behavior.panic_events,
+                "overrides_requested": behavior.overrides_requested,
+                "last_active": behavior.last_active.isoformat()
+                if behavior.last_active
+                else None,
+            },
+            "created_at": self.created_at.isoformat(),
+        }
@@ -0,0 +1,457 @@
+"""End-to-end analysis pipeline: onboarding answers in, full plan out.
+
+``run_full_analysis_async`` declares the pipeline as an explicit
+dependency graph (see :mod:`ai_engine.exec_graph`) rather than a straight
+line: scraping and interest analysis are siblings, the spine
+context -> evidence -> decision stays explicit, and the three
+post-decision LLM stages (advisor, roadmap, explanation) are siblings
+below the decision. The scheduler runs whatever is ready, so wall time
+is bounded by the critical path instead of the sum of every stage's
+latency. ``stream_full_analysis`` exposes the same run as a stream of
+per-stage events for progressive rendering; a thin sync wrapper remains
+for CLI demos.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ai_engine import _client, scrapers, state_store
+from ai_engine.circuit_breaker import CircuitBreaker
+from ai_engine.exec_graph import Graph
+from ai_engine.agents import (
+    _prompt_common,
+    decision_advisor,
+    decision_bundle,
+    explanation_bot,
+    roadmap_generator,
+)
+from ai_engine.agents.context_profiler import build_context
+from ai_engine.agents.decision_advisor import advise_decision
+from ai_engine.agents.decision_bundle import generate_bundle
+from ai_engine.agents.decision_engine import make_decision_async
+from ai_engine.agents.evidence_profiler import build_evidence
+from ai_engine.agents.explanation_bot import explain_decision
+from ai_engine.agents.interest_chatbot import analyze_interests
+from ai_engine.agents.roadmap_generator import generate_roadmap
+from ai_engine.models.user_state import UserState
+
+
+logger = logging.getLogger(__name__)
+
+# Per-stage budgets in seconds. Spine stages (everything the decision
+# needs) fail the run fast via graph-level timeouts; replaceable stages
+# (scrapers and the post-decision tail) degrade to stubs instead.
+STAGE_TIMEOUTS = {
+    "stats": 12.0,
+    "interests": 20.0,
+    "decision": 20.0,
+    "advice": 20.0,
+    "roadmap": 30.0,
+    "explanation": 20.0,
+    "bundle": 45.0,
+}
+
+# Stage snapshots shared across orchestrator instances: repeat runs
+# with unchanged inputs skip straight past the expensive stages.
+_STORE = state_store.StateStore()
+
+# One breaker per degradable stage, shared across orchestrator
+# instances: an endpoint outage is process-wide.
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def _breaker(name: str) -> CircuitBreaker:
+    breaker = _BREAKERS.get(name)
+    if breaker is None:
+        breaker = _BREAKERS[name] = CircuitBreaker(name)
+    return breaker
+
+
+async def _guard(name: str, coro_factory: Any, stub: Dict) -> Dict:
+    """Run a degradable stage under its budget and circuit breaker.
+
+    Timeouts and errors return the stage's stub annotated with a
+    ``status`` key rather than failing the pipeline; repeated failures
+    trip the breaker so later runs skip the doomed call entirely.
+    """
+    breaker = _breaker(name)
+    if not breaker.allow():
+        return {**stub, "status": "degraded"}
+    try:
+        value = await asyncio.wait_for(coro_factory(), STAGE_TIMEOUTS[name])
+    except asyncio.TimeoutError:
+        breaker.record_failure()
+        logger.warning("stage %s timed out after %ss", name, STAGE_TIMEOUTS[name])
+        return {**stub, "status": "timeout"}
+    except Exception:
+        breaker.record_failure()
+        logger.warning("stage %s failed", name, exc_info=True)
+        return {**stub, "status": "error"}
+    breaker.record_success()
+    return value
+
+
+_STATS_STUB = {"github": None, "leetcode": None}
+
+_TAIL_STUBS = {
+    "advice": decision_advisor._FALLBACK,
+    "roadmap": roadmap_generator._FALLBACK,
+    "explanation": explanation_bot._FALLBACK,
+}
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _contains_datetime(obj: Any) -> bool:
+    """Early-exit scan; no allocation, just visits until the first hit."""
+    if isinstance(obj, _PRIMITIVES):
+        return False
+    if isinstance(obj, datetime):
+        return True
+    if isinstance(obj, dict):
+        return any(_contains_datetime(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_datetime(v) for v in obj)
+    return False
+
+
+def _json_safe(obj: Any) -> Any:
+    """Convert ``obj`` into JSON-encodable primitives.
+
+    The common case — a subtree with no datetimes — is returned as-is
+    after a copy-free pre-scan, so serialization of a typical output
+    dict costs isinstance checks instead of rebuilding every container.
+    """
+    if isinstance(obj, _PRIMITIVES):
+        return obj
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        if not _contains_datetime(obj):
+            return obj
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        if isinstance(obj, list) and not _contains_datetime(obj):
+            return obj
+        return [_json_safe(v) for v in obj]
+    return obj
+
+
+class Orchestrator:
+    """Drives one user's full analysis through every agent.
+
+    The post-decision stages are optional; flags are evaluated once at
+    construction into a stage table, so per-request graph assembly only
+    iterates the enabled stages and the hot path carries no flag checks.
+    """
+
+    def __init__(
+        self,
+        *,
+        enable_advisor: bool = True,
+        enable_roadmap: bool = True,
+        enable_explanation: bool = True,
+        fuse_tail: bool = False,
+        use_summarized_context: bool = False,
+        llm_client: Optional[Any] = None,
+    ) -> None:
+        # Injection point for a caller-configured AsyncOpenAI client;
+        # swapped process-wide so every agent shares its pool.
+        if llm_client is not None:
+            _client.set_clients(async_client=llm_client)
+        tail = []
+        if enable_advisor:
+            tail.append(("advice", advise_decision))
+        if enable_roadmap:
+            tail.append(("roadmap", generate_roadmap))
+        if enable_explanation:
+            tail.append(("explanation", explain_decision))
+        self._tail = tuple(tail)
+        # Fusing trades three co-batched calls for one round trip that
+        # repeats the shared profile tokens once; only worthwhile when
+        # the full tail is enabled, so partial configurations keep the
+        # concurrent per-agent path.
+        self._fuse_tail = fuse_tail and len(self._tail) == 3
+        # Summarized context trades one cheap short-output call for a
+        # much shorter shared prefix on every tail prompt; only the
+        # unfused tail uses it (the fused bundle is a single call).
+        self._summarize = use_summarized_context and not self._fuse_tail
+
+    def prefetch_stats(
+        self,
+        github_username: Optional[str] = None,
+        leetcode_username: Optional[str] = None,
+    ) -> "asyncio.Task[None]":
+        """Speculatively warm the scraper cache before analysis starts.
+
+        Call as soon as usernames are known (e.g. at session start,
+        while the user is still answering questions): the fetch lands in
+        the scrapers' single-flight TTL cache, so the stats stage of the
+        later run is a cache hit and its latency drops off the critical
+        path entirely. Failures are swallowed — the stats stage will
+        simply fetch for real.
+        """
+
+        async def _prefetch() -> None:
+            try:
+                await scrapers.get_all_stats(github_username, leetcode_username)
+            except Exception:
+                logger.debug("stats prefetch failed", exc_info=True)
+
+        return asyncio.create_task(_prefetch())
+
+    def _build_graph(
+        self,
+        user_state: UserState,
+        answers: List[str],
+        *,
+        hours_per_week: int,
+        deadline_months: Optional[int],
+        constraints: Optional[List[str]],
+        github_username: Optional[str],
+        leetcode_username: Optional[str],
+    ) -> Graph:
+        # The stages mutate disjoint fields of user_state, so sharing it
+        # across concurrent siblings is race-free; dep kwargs are used
+        # where a stage actually consumes another's output (evidence).
+        # The LLM-backed spine stages are memoized on a content hash of
+        # their inputs: a re-run that only changed downstream knobs (a
+        # roadmap regenerate, a retry) restores the snapshots instead of
+        # recomputing. The profiles must still land on user_state on a
+        # hit, since later stages read them from there.
+        def _interests(**_: Any) -> Any:
+            key = state_store.stage_key(
+                "interests",
+                {
+                    "profile": user_state.to_dict()["basic_profile"],
+                    "answers": list(answers),
+                },
+            )
+            cached = _STORE.get(key)
+            if cached is not None:
+                user_state.interest_profile = cached
+                return cached
+            profile = analyze_interests(user_state, answers)
+            _STORE.put(key, profile)
+            return profile
+
+        def _evidence(stats: Dict) -> Any:
+            key = state_store.stage_key(
+                "evidence",
+                {"github": stats["github"], "leetcode": stats["leetcode"]},
+            )
+            cached = _STORE.get(key)
+            if cached is not None:
+                user_state.evidence_profile = cached
+                return cached
+            profile = build_evidence(user_state, stats["github"], stats["leetcode"])
+            _STORE.put(key, profile)
+            return profile
+
+        async def _decision(**_: Any) -> Any:
+            snapshot = user_state.to_dict()
+            key = state_store.stage_key(
+                "decision",
+                {
+                    "interests": snapshot["interest_profile"],
+                    "evidence": snapshot["evidence_profile"],
+                    "context": snapshot["context_profile"],
+                },
+            )
+            cached = _STORE.get(key)
+            if cached is not None:
+                user_state.decision_state = cached
+                return cached
+            decision = await make_decision_async(user_state)
+            _STORE.put(key, decision)
+            return decision
+
+        graph = Graph()
+        graph.add_step(
+            "context",
+            partial(
+                build_context,
+                user_state,
+                hours_per_week,
+                deadline_months=deadline_months,
+                constraints=constraints,
+            ),
+        )
+        async def _stats(**_: Any) -> Dict:
+            return await _guard(
+                "stats",
+                lambda: scrapers.get_all_stats(github_username, leetcode_username),
+                _STATS_STUB,
+            )
+
+        graph.add_step("stats", _stats)
+        graph.add_step(
+            "interests", _interests, timeout=STAGE_TIMEOUTS["interests"]
+        )
+        graph.add_step("evidence", _evidence, deps=("stats",))
+        graph.add_step(
+            "decision",
+            _decision,
+            deps=("context", "evidence", "interests"),
+            timeout=STAGE_TIMEOUTS["decision"],
+        )
+        if self._fuse_tail:
+
+            async def _bundle(**_: Any) -> Dict:
+                return await _guard(
+                    "bundle",
+                    lambda: generate_bundle(user_state),
+                    decision_bundle._fallback(),
+                )
+
+            graph.add_step("bundle", _bundle, deps=("decision",))
+        else:
+            tail_deps = ("decision",)
+            if self._summarize:
+
+                async def _summary(**_: Any) -> Optional[str]:
+                    try:
+                        return await _prompt_common.summarize_user_state(user_state)
+                    except Exception:
+                        # Tail prompts fall back to the structured dump.
+                        logger.debug("context summary failed", exc_info=True)
+                        return None
+
+                graph.add_step("summary", _summary, deps=("decision",))
+                tail_deps = ("decision", "summary")
+
+            for name, agent in self._tail:
+
+                async def _stage(
+                    name: str = name, agent: Any = agent, **deps: Any
+                ) -> Dict:
+                    return await _guard(
+                        name,
+                        lambda: agent(
+                            user_state, context_summary=deps.get("summary")
+                        ),
+                        _TAIL_STUBS[name],
+                    )
+
+                graph.add_step(name, _stage, deps=tail_deps)
+        return graph
+
+    async def run_full_analysis_async(
+        self,
+        user_state: UserState,
+        answers: List[str],
+        *,
+        hours_per_week: int = 10,
+        deadline_months: Optional[int] = None,
+        constraints: Optional[List[str]] = None,
+        github_username: Optional[str] = None,
+        leetcode_username: Optional[str] = None,
+    ) -> Dict:
+        # Lazy %s formatting: no string is built unless the sink is on.
+        logger.info("starting full analysis for %s", user_state.user_id)
+        graph = self._build_graph(
+            user_state,
+            answers,
+            hours_per_week=hours_per_week,
+            deadline_months=deadline_months,
+            constraints=constraints,
+            github_username=github_username,
+            leetcode_username=leetcode_username,
+        )
+        results = await graph.run()
+        decision = results["decision"]
+        logger.info(
+            "full analysis for %s done: focus=%s",
+            user_state.user_id,
+            decision.focus,
+        )
+
+        output = {
+            "user": user_state.to_dict(),
+            "decision": {
+                "focus": decision.focus,
+                "park": decision.park,
+                "drop": decision.drop,
+                "scores": decision.scores,
+                "urgency": decision.urgency,
+            },
+        }
+        if self._fuse_tail:
+            output.update(results["bundle"])
+        else:
+            for name, _ in self._tail:
+                output[name] = results[name]
+        return _json_safe(output)
+
+    @staticmethod
+    def _stage_view(name: str, value: Any) -> Any:
+        """User-facing payload for one finished stage's raw output."""
+        if name == "decision":
+            return {
+                "focus": value.focus,
+                "park": value.park,
+                "drop": value.drop,
+                "scores": value.scores,
+                "urgency": value.urgency,
+            }
+        if name == "context":
+            return {
+                "hours_per_week": value.hours_per_week,
+                "deadline_months": value.deadline_months,
+                "constraints": list(value.constraints),
+            }
+        if name == "interests":
+            return {
+                "interest_bias": dict(value.interest_bias),
+                "confidence_level": value.confidence_level.value,
+            }
+        if name == "evidence":
+            return {
+                "github_valid": value.github_valid,
+                "leetcode_valid": value.leetcode_valid,
+                "flags": sorted(value.flags),
+            }
+        return value
+
+    async def stream_full_analysis(
+        self,
+        user_state: UserState,
+        answers: List[str],
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict]:
+        """Yield ``{"stage": name, "data": ...}`` events as stages finish.
+
+        Completion order, not declaration order: the decision arrives as
+        soon as its inputs are done, without waiting on the slow roadmap
+        call, so a chat or SSE layer can render progressively. A final
+        ``user`` event carries the fully assembled state. Accepts the
+        same keyword arguments as :meth:`run_full_analysis_async`.
+        """
+        graph = self._build_graph(
+            user_state,
+            answers,
+            hours_per_week=kwargs.get("hours_per_week", 10),
+            deadline_months=kwargs.get("deadline_months"),
+            constraints=kwargs.get("constraints"),
+            github_username=kwargs.get("github_username"),
+            leetcode_username=kwargs.get("leetcode_username"),
+        )
+        async for name, value in graph.run_iter():
+            if name == "bundle":
+                for section, data in value.items():
+                    # A degraded bundle carries a top-level status
+                    # string; only the dict sections are stages.
+                    if isinstance(data, dict):
+                        yield {"stage": section, "data": _json_safe(data)}
+            else:
+                yield {"stage": name, "data": _json_safe(self._stage_view(name, value))}
+        yield {"stage": "user", "data": _json_safe(user_state.to_dict())}
+
+    def run_full_analysis(self, user_state: UserState, answers: List[str], **kwargs: Any) -> Dict:
+        """Sync wrapper for CLI demos and scripts."""
+        return asyncio.run(
+            self.run_full_analysis_async(user_state, answers, **kwargs)
+        )
@@ -0,0 +1,70 @@
+"""Shared demo fixtures: one canonical user, built once per process.
+
+Demos that only read user data take ``DEMO_USER`` directly; demos that
+run the pipeline (which mutates profiles in place) take a private copy
+from :func:`demo_user` so runs never bleed into each other. Building the
+fixture at import time means batch demo runs pay construction once
+instead of per invocation.
+"""
+
+import copy
+
+from ai_engine.models.user_state import (
+    BasicProfile,
+    Confidence,
+    InterestProfile,
+    UserState,
+)
+
+DEMO_ANSWERS = [
+    "I enjoy building things people can actually click around in.",
+    "Debugging a gnarly problem is more fun to me than styling a page.",
+    "I've been poking at pandas on a side project and liked it.",
+]
+
+
+def _build_demo_user() -> UserState:
+    return UserState(
+        user_id="demo-user-001",
+        basic_profile=BasicProfile(
+            name="Demo Student",
+            education_level="undergraduate",
+            year_of_study=2,
+            goal="land a software internship next summer",
+        ),
+        interest_profile=InterestProfile(
+            interest_bias={
+                "development": 0.7,
+                "problem_solving": 0.6,
+                "data": 0.4,
+            },
+            confidence_level=Confidence.MEDIUM,
+            raw_answers=list(DEMO_ANSWERS),
+        ),
+    )
+
+
+# Treat as read-only; demos that mutate must go through demo_user().
+DEMO_USER = _build_demo_user()
+
+
+def demo_user() -> UserState:
+    """A private, mutation-safe copy of the canonical demo user."""
+    return copy.deepcopy(DEMO_USER)
+
+
+def make_user(**overrides) -> UserState:
+    """A demo user with top-level fields replaced, e.g.
+    ``make_user(user_id="u2", decision_state=DecisionState(focus=[...]))``.
+
+    Starts from the prebuilt template rather than reconstructing the
+    nested profiles per call. The state types are plain slots
+    dataclasses, so construction is already validation-free — the point
+    of the factory is one canonical fixture instead of each demo
+    hand-rolling its own — and slots make an unknown override name an
+    immediate ``AttributeError`` rather than a silently ignored typo.
+    """
+    user = copy.deepcopy(DEMO_USER)
+    for name, value in overrides.items():
+        setattr(user, name, value)
+    return user
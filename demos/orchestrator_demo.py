@@ -0,0 +1,49 @@
+"""Drive one full analysis end to end against live services.
+
+Run from the repo root:
+
+    python -m demos.orchestrator_demo [github_username] [leetcode_username]
+
+Needs OPENAI_API_KEY in the environment (or .env); a GITHUB_TOKEN makes
+the GitHub scrape a single GraphQL round trip.
+"""
+
+import sys
+import time
+
+import orjson
+
+from ai_engine import configure_logging
+from ai_engine.orchestrator import Orchestrator
+
+from demos.fixtures import DEMO_ANSWERS, demo_user
+
+
+def main() -> None:
+    configure_logging()
+    github_username = sys.argv[1] if len(sys.argv) > 1 else None
+    leetcode_username = sys.argv[2] if len(sys.argv) > 2 else None
+
+    orchestrator = Orchestrator()
+    user = demo_user()
+
+    start = time.perf_counter()
+    result = orchestrator.run_full_analysis(
+        user,
+        DEMO_ANSWERS,
+        hours_per_week=8,
+        github_username=github_username,
+        leetcode_username=leetcode_username,
+    )
+    elapsed = time.perf_counter() - start
+
+    # orjson renders the full nested payload natively (OPT_INDENT_2)
+    # instead of walking it through stdlib json's pretty printer, and
+    # writing the bytes straight out skips a decode/re-encode.
+    sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
+    print(f"\nfull analysis in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""FastAPI surface for the FigureIt engine.
+
+Run after ``pip install -e .`` (any working directory):
+
+    uvicorn web_app.api.main:app
+
+``/start-session`` is fully async: the orchestrator coroutine is
+awaited directly, so a worker holds no thread while the pipeline waits
+on LLM and scraper I/O and one uvicorn worker keeps many sessions in
+flight.
+"""
+
+import hashlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from ai_engine import scrapers
+from ai_engine._async_cache import AsyncTTLCache
+from ai_engine.models.user_state import BasicProfile, UserState
+from ai_engine.orchestrator import Orchestrator
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the per-worker orchestrator on the serving event loop.
+
+    Construction at import time would bind anything the pipeline lazily
+    creates (client sessions, futures) to whichever loop imported the
+    module; doing it here keeps everything on the loop that serves
+    requests and keeps uvicorn startup itself cheap.
+    """
+    app.state.orchestrator = Orchestrator()
+    yield
+    # Drain the scrapers' pooled HTTP session so shutdown closes its
+    # keep-alive connections cleanly instead of leaking them.
+    await scrapers.aclose()
+
+
+# orjson for every response: the analysis payload is a large nested
+# dict, and encoding it with stdlib json would block the event loop for
+# several times longer.
+app = FastAPI(
+    title="FigureIt API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
+# Whole-session results, keyed by a digest of the request body and
+# cached as serialized bytes: an identical repeat session (demo re-runs,
+# page refreshes) is a dict hit instead of the full scraper+LLM
+# pipeline. One hour keeps it well inside the scrapers' staleness
+# budget. Single-flight, so concurrent identical requests share one run.
+_RESULT_TTL = 3600
+_RESULT_CACHE = AsyncTTLCache(ttl=_RESULT_TTL, maxsize=512)
+
+
+class StartSessionRequest(BaseModel):
+    user_id: str
+    name: str = ""
+    education_level: str = ""
+    goal: str = ""
+    answers: List[str] = []
+    hours_per_week: int = 10
+    deadline_months: Optional[int] = None
+    constraints: Optional[List[str]] = None
+    github_username: Optional[str] = None
+    leetcode_username: Optional[str] = None
+
+
+def _session_key(data: StartSessionRequest) -> str:
+    body = orjson.dumps(data.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+@app.post("/start-session")
+async def start_session(data: StartSessionRequest, request: Request) -> Response:
+    orchestrator: Orchestrator = request.app.state.orchestrator
+    ran = False
+
+    async def _run() -> bytes:
+        nonlocal ran
+        ran = True
+        user_state = UserState(
+            user_id=data.user_id,
+            basic_profile=BasicProfile(
+                name=data.name,
+                education_level=data.education_level,
+                goal=data.goal,
+            ),
+        )
+        result = await orchestrator.run_full_analysis_async(
+            user_state,
+            data.answers,
+            hours_per_week=data.hours_per_week,
+            deadline_months=data.deadline_months,
+            constraints=data.constraints,
+            github_username=data.github_username,
+            leetcode_username=data.leetcode_username,
+        )
+        # The orchestrator output is already JSON-safe primitives, so
+        # serializing once here skips FastAPI's jsonable_encoder walk
+        # and lets cache hits reuse the encoded bytes as-is.
+        return orjson.dumps(result)
+
+    payload = await _RESULT_CACHE.get(_session_key(data), _run)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"X-Cache": "MISS" if ran else "HIT"},
+    )